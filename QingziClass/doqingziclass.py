@@ -1,15 +1,17 @@
 # -*- coding: utf-8 -*-
 import copy
+import os
 import threading
 
-import SSPY.fuzzy.search as fuzzy_search
-
-from SSPY.mypdf import PdfLoad
-from SSPY.mydocx import DocxLoad
 from SSPY.PersonneInformation import DefPerson
+from SSPY.roster.index import RosterIndex, group_by_studentID, is_fuzzy_studentID
+from SSPY.roster.table import RosterTable
+from SSPY.roster.report import RosterReport
+from SSPY.roster.store import PersonStore
+from SSPY.roster.manifest import RunManifest, file_fingerprint
 from SSPY.globalconstants import GlobalConstants as gc
 from SSPY.myfolder import DefFolder, copy_file
-from SSPY.myxlsx import XlsxLoad, XlsxWrite
+from SSPY.myxlsx import XlsxLoad, XlsxWrite, XlsxBook, load_persons_parallel
 from SSPY.helperfunction import _exit, trans_list_to_str
 from SSPY.tracker.core import VariableType, monitor_variables, get_current_monitor
 from SSPY.communitor.connect import (
@@ -21,8 +23,18 @@ from SSPY.communitor.connect import (
 class DoQingziClass:
     """青字班程序控制库"""
 
-    def __init__(self):
+    def __init__(self, batch_output: bool = False, storage_export: bool = False, force_rebuild: bool = False):
+        """
+        Args:
+            batch_output:各班级的表格写入同一个工作簿的不同sheet，而不是每班一个文件
+            storage_export:报名信息写入数据库的同时导出storage.xlsx
+            force_rebuild:忽略运行清单，重新生成所有班级的表格
+        """
+        self.__batchOutput = batch_output
+        self.__storageExport = storage_export
+        self.__forceRebuild = force_rebuild
         self.__persons_all: list[DefPerson] = []  # """所有人员的名单"""
+        self.__roster_index = RosterIndex()  # 总名单索引，与__persons_all保持同步
         self.__classname_all: list[str] = []  # 所有的班级名
         self.__unknownPersons: list[tuple[DefPerson, list[DefPerson]]] = []  # 未知的人员列表
         self.__stopFlag: threading.Event | None = None  # 停止标志
@@ -32,9 +44,74 @@ class DoQingziClass:
         """自检方法"""
         pass
 
+    def __save_book(self, book: XlsxBook, prompt: str):
+        """
+        保存各班级的表格：批量模式写入一个工作簿，否则拆分为每班一个文件
+        Args:
+            book:各班级的表格
+            prompt:提示词
+        """
+        if len(book) == 0: return
+        if self.__batchOutput:
+            if book.write():
+                print(prompt + '已储存：\"' + book.path + '\"')
+            return
+        for path in book.split():
+            print(prompt + '已储存：\"' + path + '\"')
+
+    def __manifest_key(self, report: str) -> str:
+        """运行清单中的报表类型，批量输出与拆分输出的产物不同，分别记录"""
+        return report + '@book' if self.__batchOutput else report
+
+    def __dirty_classes(
+        self,
+        manifest: RunManifest,
+        report: str,
+        digests: dict[str, str],
+        paths: dict[str, str],
+        book: XlsxBook) -> set[str]:
+        """
+        需要重建的班级，其余班级的输入摘要未变且输出仍然存在
+        批量输出时所有班级在同一个工作簿中，任一班级需要重建则全部重建
+        Args:
+            manifest:运行清单
+            report:报表类型
+            digests:班级名 -> 输入摘要
+            paths:班级名 -> 拆分输出时该班的文件
+            book:批量输出的工作簿
+        """
+        key = self.__manifest_key(report)
+        if self.__batchOutput:
+            dirty = manifest.dirty(key, digests, {cn: [book.path] for cn in digests})
+            if not dirty:
+                print(f'输入未变化，跳过重建：\"{book.path}\"')
+                return set()
+            return set(digests)
+        dirty = set(manifest.dirty(key, digests, {cn: [p] for cn, p in paths.items()}))
+        skipped = [cn for cn in digests if cn not in dirty]
+        if skipped:
+            print(f'{len(skipped)}个班级的输入未变化，跳过重建：{skipped}')
+        return dirty
+
+    def __save_manifest(
+        self,
+        manifest: RunManifest,
+        report: str,
+        digests: dict[str, str],
+        dirty: set[str],
+        extra: dict[str, dict] = None):
+        """记录重建过的班级的输入摘要，中途停止时不记录"""
+        if _exit(self.__stopFlag): return
+        key = self.__manifest_key(report)
+        for cn in digests:
+            if cn in dirty:
+                manifest.update(key, cn, digests[cn], **(extra or {}).get(cn, {}))
+        manifest.save()
+
     def reset(self):
         """重置状态"""
         self.__persons_all.clear()
+        self.__roster_index.clear()
         self.__classname_all.clear()
         self.__unknownPersons.clear()
         if self.__stopFlag and isinstance(self.__stopFlag, threading.Event):
@@ -103,13 +180,13 @@ class DoQingziClass:
             paths = folder.paths
             len_paths = len(paths)
             connect_progress_default(paths)
-            i = 0
-            for p in paths:
-                i += 1
-                if _exit(self.__stopFlag): return
-                post_progress_default(i, len_paths, '加载文件 ' + p)
-                xlsx_sheet = XlsxLoad(_path = p, classname = gc.get_classname_from_path(path = p))  # 自动识别班级
-                self.__persons_all.extend(xlsx_sheet.get_personList())
+            # 多进程解析，按文件顺序合并
+            for i, p, pers in load_persons_parallel(
+                paths,
+                [gc.get_classname_from_path(path = p) for p in paths],  # 自动识别班级
+                stop_flag = self.__stopFlag):
+                post_progress_default(i + 1, len_paths, '加载文件 ' + p)
+                self.__extend_persons(pers)
         finally:
             disconnect_progress_default()
 
@@ -146,33 +223,28 @@ class DoQingziClass:
                     per_all.ifsign = True
 
         @current_monitor.add_nested_function()
-        def __make_sheet(classname: str) -> list[list[str]] | None:
+        def __make_sheet(classname: str, report: RosterReport) -> list[list[str]] | None:
             """制表"""
             if classname is None: return None
-            header = ['姓名', '学号']
             outSheet: list[list[str]] = [['序号', '姓名', '学号', '签到'], ]
-            i = 1
-            for per in self.__persons_all:
-                if per.ifsign and per.classname == classname:
-                    l: list[str] = [str(i)]
-                    l.extend(per.to_list(header))
-                    l.append('')
-                    outSheet.append(l)
-                    i += 1
+            for i, r in enumerate(report.class_rows(classname), 1):
+                l: list[str] = [str(i)]
+                l.extend(r)
+                l.append('')
+                outSheet.append(l)
             return outSheet
 
         @current_monitor.add_nested_function()
-        def __save(sheet: list[list[str]], classname: str):
+        def __save(sheet: list[list[str]], classname: str, book: XlsxBook):
+            """将签到表加入book"""
             if sheet is None or classname is None: return
             if _exit(self.__stopFlag): return
 
-            from SSPY.helperfunction import sort_table
-            sort_table(sheet,
-                lambda a, b: True
-                if len(a[2]) > len(b[2])
-                else True if len(a[2]) == len(b[2]) and a[2] > b[2]
-                else False,
-                [0, ], [0, ])
+            from SSPY.helperfunction import sort_rows
+            # 按学号长度、学号升序
+            sort_rows(sheet,
+                lambda r: (len(r[2]), r[2]),
+                exclude_rows = [0, ], exclude_cols = [0, ])
 
             path = gc.dir_OUTPUT_APP_ + classname + '.xlsx'
             writer = XlsxWrite(
@@ -186,42 +258,56 @@ class DoQingziClass:
             writer.fontRegular = gc.fontRegularSong
             writer.fontTitle = gc.fontTitleGBK
             writer.border = gc.borderThinBlack
-            if writer.can_write:
-                writer.write()
-            print('签到表已储存：\"' + path + '\"')
+            book.add(classname, writer)
 
         @current_monitor.add_nested_function()
-        def __storage():
-            """储存报名信息"""
+        def __storage(table: RosterTable):
+            """储存报名信息：总名单与本场次的报名写入数据库，可选导出storage.xlsx"""
+            if _exit(self.__stopFlag): return
+            with PersonStore(gc.dir_STORAGE_ + 'storage.db') as store:
+                store.upsert_persons(self.__persons_all)
+                session = store.new_session()
+                store.record(session, (per for per in self.__persons_all if per.ifsign))
+                print('报名信息已储存：\"' + store.path + '\"')
+            if not self.__storageExport: return
+
             sheet: list[list[str]] = []
             header = [gc.chstrQClassname, gc.chstrName, gc.chstrStudentID]
             sheet.append(header)
-            for per in self.__persons_all:
-                if _exit(self.__stopFlag): return
-                if per.ifsign:
-                    sheet.append(per.to_list(header))
+            if _exit(self.__stopFlag): return
+            sheet.extend(table.project(header, table.mask(ifsign = True)))
             path = gc.dir_STORAGE_ + 'storage.xlsx'
             XlsxWrite(
                 path = path,
                 sheet = sheet,
                 font_regular = gc.fontRegularSongSmall
             ).write()
-            print('报名信息已储存：\"' + path + '\"')
+            print('报名信息已导出：\"' + path + '\"')
 
         pers_app, cns = __load_person_app()
         try:
             connect_progress_default(cns)
             __person_sign(pers_app)
+            roster = RosterTable.from_persons(self.__persons_all)
+            report = RosterReport(roster, ['姓名', '学号'], roster.mask(ifsign = True))
+            book = XlsxBook(gc.dir_OUTPUT_APP_ + '签到表.xlsx')
+            manifest = RunManifest(gc.dir_STORAGE_ + 'manifest.json', force = self.__forceRebuild)
+            digests = {cn: manifest.digest(report.class_rows(cn)) for cn in cns}
+            dirty = self.__dirty_classes(
+                manifest, 'app', digests, {cn: gc.dir_OUTPUT_APP_ + cn + '.xlsx' for cn in cns}, book)
             len_cns = len(cns)
             """班级名字list的长度"""
             for i in range(len_cns):
+                if cns[i] not in dirty: continue
                 post_progress_default(i, len_cns, f'处理班级{cns[i]}中...')
-                sh = __make_sheet(cns[i])
-                __save(sh, cns[i])
+                sh = __make_sheet(cns[i], report)
+                __save(sh, cns[i], book)
+            self.__save_book(book, '签到表')
+            self.__save_manifest(manifest, 'app', digests, dirty)
         finally:
             disconnect_progress_default()
 
-        __storage()
+        __storage(roster)
         self.__unknownSheet()
 
     @monitor_variables(
@@ -252,6 +338,7 @@ class DoQingziClass:
         @current_monitor.add_nested_function(return_value = [])
         def __parse_imgs(cn_ip: dict[str, list[str]]) -> list[DefPerson] | None:
             if cn_ip is None: return None
+            if len(cn_ip) == 0: return []  # 没有需要识别的照片时不加载OCR模型
             persons_att: list[DefPerson] = []
             # 启用ocr
             from SSPY.myimg import PPOCRImgByModel
@@ -287,43 +374,40 @@ class DoQingziClass:
                         per_all.ifcheck = True
 
         @current_monitor.add_nested_function()
-        def __make_sheet(classname: str) -> list[list[str]] | None:
+        def __make_sheet(classname: str, table: RosterTable, report: RosterReport) -> list[list[str]] | None:
             """制表"""
             if classname is None: return None
-            in_header = [gc.chstrName, gc.chstrStudentID, gc.chstrAcademy, '联系方式']
             out: list[list[str]] = [
                 [gc.chstrName, gc.chstrStudentID, gc.chstrAcademy, '联系方式', gc.chstrCheckIn, '备注'], ]
-            for per in self.__persons_all:
-                if per.classname == classname:
-                    l = per.to_list(in_header)
-                    if per.ifcheck:
-                        l.append('已签到')
-                    elif per.ifsign:
-                        l.append('缺席')
-                    else:
-                        l.append('')
-                    if per.ifsign:
-                        l.append('')
-                    else:
-                        l.append('未报名')
-                    out.append(l)
+            idx = report.indices(classname)
+            rows = report.class_rows(classname)
+            for l, ifsign, ifcheck in zip(rows, table.ifsign[idx].tolist(), table.ifcheck[idx].tolist()):
+                if ifcheck:
+                    l.append('已签到')
+                elif ifsign:
+                    l.append('缺席')
+                else:
+                    l.append('')
+                if ifsign:
+                    l.append('')
+                else:
+                    l.append('未报名')
+                out.append(l)
             return out
 
         @current_monitor.add_nested_function()
-        def __save(sheet: list[list[str]], classname: str):
-            """保存签到表"""
+        def __save(sheet: list[list[str]], classname: str, book: XlsxBook):
+            """将签到汇总表加入book"""
             if _exit(self.__stopFlag): return
             if sheet is None or classname is None: return
 
             from openpyxl.styles import Font
-            from SSPY.helperfunction import sort_table
-            sort_table(sheet,
-                lambda a, b: True
-                if len(a[4]) < len(b[4])
-                else True
-                if len(a[4]) == len(b[4]) and a[2] > b[2]
-                else False,
-                [0, ])
+            from SSPY.helperfunction import sort_rows
+            # 按签到状态长度降序、学院升序
+            sort_rows(sheet,
+                [lambda r: len(r[4]), lambda r: r[2]],
+                reverse = [True, False],
+                exclude_rows = [0, ])
 
             path = gc.dir_OUTPUT_ATT_ + classname + '线下签到汇总表.xlsx'
             writer = XlsxWrite(
@@ -337,16 +421,39 @@ class DoQingziClass:
             writer.title = classname + '线下签到汇总表'
             writer.fontTitle = Font(name = '方正小标宋简体', size = 26)
             writer.border = gc.borderThinBlack
-            writer.write()
-            print('线下签到汇总表已储存：\"' + path + '\"')
+            book.add(classname, writer)
 
         self.__load_storage()
-        pers_att = __parse_imgs(__organize_imgs())
+        cn_ip = __organize_imgs()
+        if cn_ip is None: return
+
+        roster = RosterTable.from_persons(self.__persons_all)
+        report = RosterReport(roster, [gc.chstrName, gc.chstrStudentID, gc.chstrAcademy, '联系方式'])
+        book = XlsxBook(gc.dir_OUTPUT_ATT_ + '线下签到汇总表.xlsx')
+        # 输入：该班总名单行与报名标志、该班的签到照片（场次编号不计入，相同的报名不应使各班失效）
+        manifest = RunManifest(gc.dir_STORAGE_ + 'manifest.json', force = self.__forceRebuild)
+        digests = {cn: manifest.digest(
+            report.class_rows(cn),
+            roster.ifsign[report.indices(cn)].tolist(),
+            [file_fingerprint(p) for p in cn_ip.get(cn, [])])
+            for cn in dict.fromkeys(self.__classname_all + list(cn_ip))}
+        dirty = self.__dirty_classes(
+            manifest, 'att', digests,
+            {cn: gc.dir_OUTPUT_ATT_ + cn + '线下签到汇总表.xlsx' for cn in self.__classname_all}, book)
+        pers_att = __parse_imgs({cn: ps for cn, ps in cn_ip.items() if cn in dirty})
 
         __person_checkin(pers_att)
+        self.__save_checkin()
+        roster.refresh_flags(self.__persons_all)  # 只刷新签到标志，行顺序不变
         for cn in self.__classname_all:
-            __save(__make_sheet(cn), cn)
-        self.__unknownSheet()
+            if cn not in dirty: continue
+            __save(__make_sheet(cn, roster, report), cn, book)
+        self.__save_book(book, '线下签到汇总表')
+        key = self.__manifest_key('att')
+        cached_unknown = [r for cn in digests if cn not in dirty for r in manifest.get(key, cn, 'unknown', [])]
+        self.__save_manifest(manifest, 'att', digests, dirty,
+            {cn: {'unknown': self.__unknown_rows(cn) or []} for cn in dirty})
+        self.__unknownSheet(cached_unknown)
 
     @monitor_variables(
         target_var = '__stopFlag',
@@ -355,7 +462,7 @@ class DoQingziClass:
         return_value = None)
     def signforqcSheet(self):
         """青字班报名统计,per.ifsign表示是否报名班委"""
-        from SSPY.parseperson import renormalization
+        from SSPY.parseperson import parse_forms_parallel
 
         unknown_paths: list[str] = []
         """未知（无法解析）的文件的路径"""
@@ -374,92 +481,39 @@ class DoQingziClass:
             imgpaths = folder.get_paths_by(gc.extensions_IMG)
             return pdfpaths, docxpaths,imgpaths
 
-        @current_monitor.add_nested_function(return_value = [])
-        def __parse_docxs(paths: list[str]) -> list[DefPerson]:
-            """解析docx文件"""
-            if paths is None or (isinstance(paths, list) and len(paths)) == 0: return []
-            nonlocal unknown_paths
-            pers: list[DefPerson] = []
-
-            try:
-                len_paths = len(paths)
-                connect_progress_default(len_paths)
-                i = 0
-
-                for p in paths:
-                    if _exit(self.__stopFlag):  return []
-                    i += 1
-                    post_progress_default(i, len_paths,
-                        f'解析DOCX文件 {p}')
-                    word = DocxLoad(p)
-
-                    sh_per1 = word.get_sheet_without_enter('所任职务')
-                    """学员报名"""
-                    sh_per2 = word.get_sheet_without_enter('应聘岗位')
-                    """班委报名"""
-                    if sh_per1 is not None:
-                        per = renormalization(sh_per1, p, False)
-                        if per is None:
-                            unknown_paths.append(p)
-                            continue
-                        pers.append(per)
-                        continue
-                    elif sh_per2 is not None:
-                        per = renormalization(sh_per2, p, True)
-                        if per is None:
-                            unknown_paths.append(p)
-                            continue
-                        pers.append(per)
-                        continue
-                    else:
-                        unknown_paths.append(p)
-            finally:
-                disconnect_progress_default()
-            return pers
-
-        @current_monitor.add_nested_function(return_value = [])
-        def __parse_pdfs(paths: list[str]) -> list[DefPerson]:
-            """解析pdf文件"""
-            if paths is None or len(paths) == 0: return []
+        @current_monitor.add_nested_function(return_value = ([], []))
+        def __parse_forms(docx_paths: list[str], pdf_paths: list[str]) -> tuple[list[DefPerson], list[DefPerson]]:
+            """解析docx与pdf文件，两类文件提交到同一个进程池"""
             nonlocal unknown_paths
             nonlocal cmtts_paths
-            pers: list[DefPerson] = []
+            docx_paths = docx_paths or []
+            pdf_paths = pdf_paths or []
+            paths = docx_paths + pdf_paths
+            if len(paths) == 0: return [], []
+            pers_doc: list[DefPerson] = []
+            pers_pdf: list[DefPerson] = []
 
             try:
                 len_paths = len(paths)
                 connect_progress_default(len_paths)
-                i = 0
-
-                for p in paths:
-                    if _exit(self.__stopFlag):  return []
-                    i += 1
-                    post_progress_default(i, len_paths,
-                        f'解析PDF文件 {p}')
-                    pdf = PdfLoad(p)
-                    sh1 = pdf.get_sheet('应聘岗位', True)
-                    sh2 = pdf.get_sheet('所任职务', True)
-
-                    if sh1 is not None:
-                        per = renormalization(sh1, p, True)
-                        if per is None:
-                            unknown_paths.append(p)
-                            continue
-                        cmtts_paths.append(p)
-                        pers.append(per)
-                        continue
-                    elif sh2 is not None:
-                        per = renormalization(sh2, p, False)
-                        if per is None:
-                            unknown_paths.append(p)
-                            continue
-                        pers.append(per)
+                # 多进程解析，按文件顺序合并
+                for i, p, per in parse_forms_parallel(paths, stop_flag = self.__stopFlag):
+                    is_pdf = i >= len(docx_paths)
+                    post_progress_default(i + 1, len_paths,
+                        f'解析{"PDF" if is_pdf else "DOCX"}文件 {p}')
+                    if per is None:
+                        unknown_paths.append(p)
                         continue
+                    if is_pdf:
+                        if per.ifsign:
+                            cmtts_paths.append(p)
+                        pers_pdf.append(per)
                     else:
-                        unknown_paths.append(p)
+                        pers_doc.append(per)
+                if _exit(self.__stopFlag):  return [], []
             finally:
                 disconnect_progress_default()
-
-            return pers
+            return pers_doc, pers_pdf
 
         @current_monitor.add_nested_function()
         def __copy_key_files():
@@ -509,18 +563,18 @@ class DoQingziClass:
 
             print('正在制表...')
 
-            cn_sheet: dict[str, list[list[str]]] = {}
-            for per in self.__persons_all:
-                row = per.to_list(header)
-                row.append('是' if per.ifsign else '否')
+            persons = self.__persons_all
+            table = RosterTable.from_persons(persons)
+            report = RosterReport(table, header, classes = lambda i: persons[i].gen_classes())
+            for row, ifsign in zip(report.rows, table.ifsign.tolist()):
+                row.append('是' if ifsign else '否')
                 sheet.append(row)
 
-                for c in per.gen_classes():
-                    if cn_sheet.get(c, None) is None:
-                        cn_sheet[c] = [copy.deepcopy(header), ]
-                        cn_sheet[c][0].append('是否报名班委')
-                    cr = copy.deepcopy(row)
-                    cr[-2] = trans_list_to_str(per.savepath)
+            cn_sheet: dict[str, list[list[str]]] = {}
+            for c in report.classnames:
+                cn_sheet[c] = [sheet[0][:]]
+                for i, cr in zip(report.indices(c), report.class_rows(c, copy = True)):
+                    cr[-2] = trans_list_to_str(persons[i].savepath)
                     cn_sheet[c].append(cr)
 
             # 生成序号
@@ -552,13 +606,15 @@ class DoQingziClass:
             )
             writer.write()
 
+            book = XlsxBook(gc.dir_OUTPUT_SIGNFORQC_ + '各班报名.xlsx')
             for c in cn_sheet:
-                XlsxWrite(
+                book.add(c, XlsxWrite(
                     sheet = cn_sheet[c],
                     path = gc.dir_OUTPUT_SIGNFORQC_classmate + f'/{c}报名.xlsx',
                     font_regular = gc.fontRegularSongSmall,
                     alignment = Alignment(vertical = 'center')
-                ).write()
+                ))
+            self.__save_book(book, '各班报名表')
 
         @current_monitor.add_nested_function()
         def __copy_unknown():
@@ -575,12 +631,12 @@ class DoQingziClass:
 
         pdf_paths, docx_paths,img_paths = __organize_files()
         unknown_paths.extend(img_paths)
-        pers_doc = __parse_docxs(docx_paths)
+        pers_doc, pers_pdf = __parse_forms(docx_paths, pdf_paths)
         if pers_doc is None or len(pers_doc) == 0:
             return
         else:
-            self.__persons_all.extend(pers_doc)
-        self.__persons_all.extend(__parse_pdfs(pdf_paths))
+            self.__extend_persons(pers_doc)
+        self.__extend_persons(pers_pdf)
         self.deduplication()  # 去重
         __copy_key_files()
         s, cs = __make_sheet_all()
@@ -592,37 +648,83 @@ class DoQingziClass:
         var_type = VariableType.INSTANCE_PRIVATE,
         condition = _exit,
         return_value = None)
-    def __load_storage(self):
-        """加载临时文件，自动报名"""
-        pers_app = XlsxLoad(
-            _path = gc.dir_STORAGE_ + 'storage.xlsx',
-            const_classname = False,
-            ifp = True
-        ).get_personList()
-        for p_app in pers_app:
-            for per in self.__persons_all:
-                if per.classname == p_app.classname and self.is_same_studentID(per.studentID, p_app.studentID):
-                    per.ifsign = True
+    def __load_storage(self) -> int:
+        """
+        加载最近一场的报名信息，自动报名；数据库中没有场次时读取storage.xlsx
+        Returns:
+            未能与总名单匹配的储存人员数量
+        """
+        pers_app: list[DefPerson] | None = None
+        path = gc.dir_STORAGE_ + 'storage.db'
+        if os.path.exists(path):
+            with PersonStore(path) as store:
+                session = store.latest_session()
+                if session is not None:
+                    pers_app = store.attendees(session, ifsign = True)
+        if pers_app is None:
+            pers_app = XlsxLoad(
+                _path = gc.dir_STORAGE_ + 'storage.xlsx',
+                const_classname = False,
+                ifp = True
+            ).get_personList()
+        joined, missed = self.__roster_index.join_by_studentID(pers_app)
+        for p_app, pers in joined:
+            for per in pers:
+                per.ifsign = True
+        if len(missed) > 0:
+            print(f'储存中有{len(missed)}条报名信息未能匹配总名单：')
+            header = [gc.chstrQClassname, gc.chstrName, gc.chstrStudentID]
+            for p_app in missed:
+                print(p_app.to_list(header))
+        return len(missed)
+
+    def __save_checkin(self):
+        """将签到标志记录到最近一场（没有场次时新建），历史场次保持不变"""
+        if _exit(self.__stopFlag): return
+        with PersonStore(gc.dir_STORAGE_ + 'storage.db') as store:
+            session = store.latest_session()
+            if session is None: session = store.new_session()
+            store.record(session, (per for per in self.__persons_all if per.ifsign or per.ifcheck))
+
+    def __unknown_rows(self, classname: str = None) -> list[list[str]] | None:
+        """
+        未知人员表的行：未知人员及其可能对应的总名单人员
+        Args:
+            classname:只取该班级的未知人员，None为全部
+        Returns:
+            行，停止时为None
+        """
+        rows: list[list[str]] = []
+        header = [gc.chstrQClassname, gc.chstrName, gc.chstrStudentID]
+        for per in self.__unknownPersons:
+            if _exit(self.__stopFlag): return None
+            if classname is not None and per[0].classname != classname: continue
+            l: list[str] = ['*UNKNOWN', ]
+            l.extend(per[0].to_list(header))
+            rows.append(l)
+            for lp in per[1]:
+                l2: list[str] = ['-LIKELY', ]
+                l2.extend(lp.to_list(header))
+                rows.append(l2)
+        return rows
 
     @monitor_variables(
         target_var = '__stopFlag',
         var_type = VariableType.INSTANCE_PRIVATE,
         condition = _exit,
         return_value = None)
-    def __unknownSheet(self):
+    def __unknownSheet(self, cached_rows: list[list[str]] = None):
+        """
+        输出未知人员表
+        Args:
+            cached_rows:本次跳过重建的班级在运行清单中保存的未知人员行
+        """
         sheet: list[list[str]] = [['类型', gc.chstrQClassname, gc.chstrName, gc.chstrStudentID], ]
-        header = [gc.chstrQClassname, gc.chstrName, gc.chstrStudentID]
-        if len(self.__unknownPersons) > 0:
-            for per in self.__unknownPersons:
-                if _exit(self.__stopFlag): return
-                # print(per[0])
-                l: list[str] = ['*UNKNOWN', ]
-                l.extend(per[0].to_list(header))
-                sheet.append(l)
-                for lp in per[1]:
-                    l2: list[str] = ['-LIKELY', ]
-                    l2.extend(lp.to_list(header))
-                    sheet.append(l2)
+        rows = self.__unknown_rows()
+        if rows is None: return
+        sheet.extend(rows)
+        if cached_rows: sheet.extend(cached_rows)
+        if len(sheet) > 1:
             for r in sheet:
                 if _exit(self.__stopFlag): return
                 print(r)
@@ -643,23 +745,18 @@ class DoQingziClass:
         condition = _exit,
         return_value = None)
     def deduplication(self):
-        """去重"""
+        """去重，按照规范学号单次分组，组内按照文件顺序合并"""
         unique_pers: list[DefPerson] = []
         """去重之后的人员列表"""
-        exclude_index: list[int] = []
-        """去重的时候，已经被去除的index"""
-        for i in range(len(self.__persons_all)):
-            if i in exclude_index: continue
-            per = self.__persons_all[i]
-            for j in range(i + 1, len(self.__persons_all)):
-                if not self.is_same_studentID(per.studentID, self.__persons_all[j].studentID):
-                    continue
+        for group in group_by_studentID(self.__persons_all):
+            per = group[0]
+            for other in group[1:]:
                 # 同一个学号
-                per.merge(self.__persons_all[j])
-                exclude_index.append(j)
+                per.merge(other)
             per.optimize()
             unique_pers.append(per)
         self.__persons_all = unique_pers  # 更换地址
+        self.__roster_index.rebuild(self.__persons_all)
 
     @monitor_variables(
         target_var = '__stopFlag',
@@ -668,29 +765,19 @@ class DoQingziClass:
         return_value = None)
     def search(self, target: DefPerson, push_unknown = False) -> DefPerson | None:
         """从全部的库中搜索目标人员，返回总表人员的指针"""
-        same_name = 0
-        maybe_per = None
-        for per_a in self.__persons_all:
-            if per_a.classname == target.classname:
-                if self.is_same_studentID(target.studentID, per_a.studentID):
-                    return per_a
-                elif target.name == per_a.name:
-                    maybe_per = per_a
-                    same_name += 1
-        if same_name == 1:
-            return maybe_per
+        per = self.__roster_index.search(target)
+        if per is not None:
+            return per
         if push_unknown:
-            likely: list[DefPerson] = []
-            for per_a in self.__persons_all:
-                if per_a.classname == target.classname:
-                    if self.is_fuzzy_studentID(target.studentID, per_a.studentID):
-                        likely.append(copy.deepcopy(per_a))
-                    elif fuzzy_search.match_by(per_a.name, target.name, fuzzy_search.LEVEL.High):
-                        likely.append(copy.deepcopy(per_a))
+            likely = self.__roster_index.find_likely(target)
             self.__unknownPersons.append((copy.deepcopy(target), likely))
 
         return None
 
+    def __extend_persons(self, persons: list[DefPerson]):
+        """向总名单中添加人员，同时更新索引"""
+        self.__persons_all.extend(persons)
+        self.__roster_index.extend(persons)
 
     @staticmethod
     def is_same_studentID(a: str, b: str) -> bool:
@@ -706,10 +793,4 @@ class DoQingziClass:
 
     @staticmethod
     def is_fuzzy_studentID(a: str, b: str) -> bool:
-        if len(a) < 4 or len(b) < 4: return False
-        if a.endswith(('t', 'T')) and b.endswith(('t', 'T')):
-            a_number_part = a[:-1]
-            b_number_part = b[:-1]
-            return fuzzy_search.match_by(a_number_part, b_number_part, fuzzy_search.LEVEL.High)
-        else:
-            return fuzzy_search.match_by(a, b, fuzzy_search.LEVEL.High)
+        return is_fuzzy_studentID(a, b)
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 import copy
 import os.path
+import sys
 from .globalconstants import GlobalConstants as gc
+from .fuzzy.keyword import KeywordResolver
+from .helperfunction import trans_list_to_str, FrozenList
 import types
 
 
@@ -41,6 +44,21 @@ class DefPerson:
         gc.chstrFilePath          : (gc.chstrFilePath, '地址', '文件路径', '路径', 'path')
     }
     __keyWordTuple = types.MappingProxyType(__raw_key_word)
+    __resolver = KeywordResolver(__keyWordTuple)
+    """编译后的标准键解析器"""
+
+    __FIELDS = tuple(sys.intern(k) for k in __raw_key_word.keys()
+                     if k not in (gc.chstrQClassname, gc.chstrFilePath))
+    """储存于__values中的标准键，顺序即为下标"""
+    __FIELD_INDEX = types.MappingProxyType({k: i for i, k in enumerate(__FIELDS)})
+    """标准键 -> __values中的下标"""
+    __DEFAULT_VALUES = tuple('' if k in (
+        gc.chstrName, gc.chstrGrade, gc.chstrStudentID, gc.chstrPoliticalOutlook, gc.chstrAcademy,
+        gc.chstrMajor, gc.chstrPhone, gc.chstrQQ, gc.chstrPosition, gc.chstrEmail,
+        gc.chstrEthnicity, gc.chstrClub, gc.chstrSignPosition) else None for k in __FIELDS)
+    """新建人员时各标准键的初值，None表示此键不存在"""
+
+    __slots__ = ('__classname', '__ifcheck', '__ifsign', '__values', '__extra', '__filepaths', '__savepaths')
 
     def __init__(self,
                  cname: str = None,
@@ -59,100 +77,126 @@ class DefPerson:
         self.__classname: str = ''
         self.__ifcheck = False
         self.__ifsign = False
-        self.__information = {
-            gc.chstrName            : '',
-            gc.chstrGrade           : '',
-            gc.chstrStudentID       : '',
-            gc.chstrPoliticalOutlook: '',
-            gc.chstrAcademy         : '',
-            gc.chstrMajor           : '',
-            gc.chstrPhone           : '',
-            gc.chstrQQ              : '',
-            gc.chstrPosition        : '',
-            gc.chstrEmail           : '',
-            gc.chstrEthnicity       : '',
-            gc.chstrClub            : '',
-            gc.chstrSignPosition    : ''}  # 信息
-
-        self.__filepaths: dict[str, str] = {}  # 此人员相关的文件路径
-        """哈希值+文件路径"""
-        self.__savepaths: list[str] = []  # 保存的文件路径
-        """到哪里去"""
+        self.__values: list = list(DefPerson.__DEFAULT_VALUES)
+        """标准键的信息，按照__FIELD_INDEX存放"""
+        self.__extra: dict[str, str] | None = None
+        """非标准键的信息，需要时才创建"""
+        self.__filepaths: dict[str, str] | None = None  # 此人员相关的文件路径
+        """哈希值+文件路径，需要时才创建"""
+        self.__savepaths: list[str] | None = None  # 保存的文件路径
+        """到哪里去，需要时才创建"""
         if cname is not None: self.__classname = cname
-        if name is not None: self.__information[gc.chstrName] = name
+        if name is not None: self.__values[DefPerson.__FIELD_INDEX[gc.chstrName]] = name
         if studentID is not None:
-            self.__information[gc.chstrStudentID] = studentID
+            self.__values[DefPerson.__FIELD_INDEX[gc.chstrStudentID]] = studentID
 
     def __str__(self) -> str:
         """适配print函数"""
         d = {gc.chstrQClassname: self.__classname, }
-        d.update(self.__information)
+        d.update(self.__information_dict())
         d['ifsign'] = str(self.__ifsign)
         d['ifcheck'] = str(self.__ifcheck)
         return str(d)
 
+    def __copy__(self) -> 'DefPerson':
+        """拷贝：信息值为不可变的字符串，复制容器即可得到独立的对象"""
+        new_instance = DefPerson.__new__(DefPerson)
+        new_instance.__classname = self.__classname
+        new_instance.__ifcheck = self.__ifcheck
+        new_instance.__ifsign = self.__ifsign
+        new_instance.__values = [v.copy() if isinstance(v, list) else v for v in self.__values]
+        new_instance.__extra = None if self.__extra is None else {
+            k: (v.copy() if isinstance(v, list) else v) for k, v in self.__extra.items()}
+        new_instance.__filepaths = None if self.__filepaths is None else self.__filepaths.copy()
+        new_instance.__savepaths = None if self.__savepaths is None else self.__savepaths.copy()
+        return new_instance
+
     def __deepcopy__(self, memo: dict | None = None) -> 'DefPerson':
         """
-        自定义深拷贝逻辑：确保拷贝对象与原对象独立
+        深拷贝，与__copy__相同
         :param memo: 缓存已拷贝对象，避免循环引用
         :return: DefPerson 深拷贝实例
         """
-        # 1. 初始化memo（若未传入）
         if memo is None:
             memo = {}
-
-        # 2. 检查当前实例是否已拷贝（避免循环引用重复拷贝）
         if id(self) in memo:
             return memo[id(self)]
-
-        # 3. 深拷贝核心可变属性：__information（字典需递归拷贝）
-        new_information = copy.deepcopy(self.__information, memo)
-
-        # 4. 初始化新实例（不可变属性直接赋值，无需深拷贝）
-        new_instance = DefPerson(
-            cname = self.__classname,  # __classname是字符串（不可变）
-            name = self.__information[gc.chstrName],  # 从原信息中取姓名（避免重复处理）
-            studentID = self.__information[gc.chstrStudentID]  # 同理取学号
-        )
-
-        # 5. 补充赋值其他私有属性（__ifcheck、__ifsign是布尔值，不可变）
-        new_instance.__ifcheck = self.__ifcheck
-        new_instance.__ifsign = self.__ifsign
-        # 覆盖__information：因为DefPerson.__init__会初始化空字典，需替换为深拷贝的字典
-        new_instance.__information = new_information
-        new_instance.__filepaths = copy.deepcopy(self.__filepaths)
-
-        # 6. 将新实例存入memo，标记为已拷贝
+        new_instance = self.__copy__()
         memo[id(self)] = new_instance
-
         return new_instance
 
+    def to_record(self) -> tuple:
+        """紧凑的人员记录（只含内置类型），用于跨进程传递"""
+        return (self.__classname, self.__ifcheck, self.__ifsign, tuple(self.__values),
+                self.__extra, self.__filepaths, self.__savepaths)
+
+    @staticmethod
+    def from_record(record: tuple) -> 'DefPerson':
+        """由to_record产生的记录还原人员"""
+        per = DefPerson.__new__(DefPerson)
+        (per.__classname, per.__ifcheck, per.__ifsign, values,
+         per.__extra, per.__filepaths, per.__savepaths) = record
+        per.__values = list(values)
+        return per
+
+    def __get(self, key: str, default = None):
+        """按照信息键取值，键不存在时返回default"""
+        i = DefPerson.__FIELD_INDEX.get(key, None)
+        if i is not None:
+            v = self.__values[i]
+            return default if v is None else v
+        if self.__extra is None: return default
+        return self.__extra.get(key, default)
+
+    def __set(self, key: str, value):
+        """按照信息键赋值"""
+        i = DefPerson.__FIELD_INDEX.get(key, None)
+        if i is not None:
+            self.__values[i] = value
+            return
+        if self.__extra is None: self.__extra = {}
+        self.__extra[sys.intern(key) if isinstance(key, str) else key] = value
+
+    def __field(self, key: str) -> str:
+        """读取标准键，键不存在时创建为空字符"""
+        i = DefPerson.__FIELD_INDEX[key]
+        v = self.__values[i]
+        if v is None:
+            self.__values[i] = ''
+            return ''
+        return v
+
+    def __information_dict(self) -> dict:
+        """存在的全部信息，标准键在前"""
+        d = {k: v for k, v in zip(DefPerson.__FIELDS, self.__values) if v is not None}
+        if self.__extra is not None: d.update(self.__extra)
+        return d
 
     def optimize(self):
         """用于优化储存的信息"""
-        if self.__information.get(gc.chstrEthnicity, '') != '':
-            if not (self.__information[gc.chstrEthnicity].endswith('族')):
-                self.__information[gc.chstrEthnicity] += '族'
-        if self.__information.get(gc.chstrPoliticalOutlook, '') != '':
-            if self.__information[gc.chstrPoliticalOutlook] == '无':
-                self.__information[gc.chstrPoliticalOutlook] = '群众'
-            elif '团' in self.__information[gc.chstrPoliticalOutlook]:
-                self.__information[gc.chstrPoliticalOutlook] = '共青团员'
-            elif '党' in self.__information[gc.chstrPoliticalOutlook]:
-                if '预' in self.__information[gc.chstrPoliticalOutlook]:
-                    self.__information[gc.chstrPoliticalOutlook] = '中共预备党员'
+        if self.__get(gc.chstrEthnicity, '') != '':
+            if not (self.__get(gc.chstrEthnicity).endswith('族')):
+                self.__set(gc.chstrEthnicity, self.__get(gc.chstrEthnicity) + '族')
+        if self.__get(gc.chstrPoliticalOutlook, '') != '':
+            if self.__get(gc.chstrPoliticalOutlook) == '无':
+                self.__set(gc.chstrPoliticalOutlook, '群众')
+            elif '团' in self.__get(gc.chstrPoliticalOutlook):
+                self.__set(gc.chstrPoliticalOutlook, '共青团员')
+            elif '党' in self.__get(gc.chstrPoliticalOutlook):
+                if '预' in self.__get(gc.chstrPoliticalOutlook):
+                    self.__set(gc.chstrPoliticalOutlook, '中共预备党员')
                 else:
-                    self.__information[gc.chstrPoliticalOutlook] = '中共党员'
-        if self.__information.get(gc.chstrStudentID, '') != '' and len(str(self.__information[gc.chstrStudentID])) > 4:
-            first4 = self.__information[gc.chstrStudentID][:4]
+                    self.__set(gc.chstrPoliticalOutlook, '中共党员')
+        if self.__get(gc.chstrStudentID, '') != '' and len(str(self.__get(gc.chstrStudentID))) > 4:
+            first4 = self.__get(gc.chstrStudentID)[:4]
             if first4.isdigit():
-                if self.__information.get(gc.chstrGrade, '') != '':
-                    if '研' in self.__information[gc.chstrGrade]:
-                        self.__information[gc.chstrGrade] = '研' + first4 + '级'
+                if self.__get(gc.chstrGrade, '') != '':
+                    if '研' in self.__get(gc.chstrGrade):
+                        self.__set(gc.chstrGrade, '研' + first4 + '级')
                     else:
-                        self.__information[gc.chstrGrade] = first4 + '级'
+                        self.__set(gc.chstrGrade, first4 + '级')
                 else:
-                    self.__information[gc.chstrGrade] = first4 + '级'
+                    self.__set(gc.chstrGrade, first4 + '级')
         if len(self.__classname) > 0:
             orgcn = self.__classname
             """原始名称"""
@@ -177,13 +221,13 @@ class DefPerson:
         if str(value) == 'None': return
         key = self.get_stdkey(inkey, inkey_as_sub = inkey_as_sub, stdkey_as_sub = stdkey_as_sub)
         if key is None:
-            self.__information[inkey] = value
+            self.__set(inkey, value)
         elif key == gc.chstrQClassname:
             self.__classname = value
         elif key == gc.chstrFilePath:
             self.filepath = value
         else:
-            self.__information[key] = value
+            self.__set(key, value)
 
     def get_information(
         self, inkey: str,
@@ -198,21 +242,20 @@ class DefPerson:
             stdkey_as_sub:标准键作为字串
             return_str:只返回str
         """
-        from .helperfunction import trans_list_to_str
-        if self.__information.get(inkey, None) is None:
+        if self.__get(inkey) is None:
             key = self.get_stdkey(inkey, inkey_as_sub = inkey_as_sub, stdkey_as_sub = stdkey_as_sub)
             if key is None:
-                return self.__information.get(inkey, '')
+                return self.__get(inkey, '')
             elif key == gc.chstrQClassname:
                 return self.__classname
             elif key == gc.chstrFilePath:
                 if return_str:
-                    return trans_list_to_str([v for k,v in self.__filepaths.items()])
+                    return trans_list_to_str(list(self.__filepaths.values()) if self.__filepaths is not None else [])
                 return self.filepath
             else:
-                return self.__information.get(key, '')
+                return self.__get(key, '')
         else:
-            return self.__information.get(inkey, '')
+            return self.__get(inkey, '')
 
 
     @staticmethod
@@ -230,30 +273,16 @@ class DefPerson:
         Returns:
             标准键参数
         """
-        if inkey is None or inkey == '': return None
-        for k in DefPerson.__keyWordTuple.keys():
-            for item in DefPerson.__keyWordTuple[k]:
-                if inkey == item:  # 采用字串检测
-                    return k
-        if inkey_as_sub:
-            for k in DefPerson.__keyWordTuple.keys():
-                for item in DefPerson.__keyWordTuple[k]:
-                    if inkey in item:
-                        return k
-        if stdkey_as_sub:
-            for k in DefPerson.__keyWordTuple.keys():
-                for item in DefPerson.__keyWordTuple[k]:
-                    if item in inkey:
-                        return k
-        return None
+        return DefPerson.__resolver.resolve(inkey, inkey_as_sub = inkey_as_sub, stdkey_as_sub = stdkey_as_sub)
 
     @property
     def keyWordTuple(self):
         return copy.deepcopy(self.__keyWordTuple)
 
     @property
-    def information(self):
-        return copy.deepcopy(self.__information)
+    def information(self) -> types.MappingProxyType:
+        """只读视图"""
+        return types.MappingProxyType(self.__information_dict())
 
     @property
     def classname(self):
@@ -261,101 +290,59 @@ class DefPerson:
 
     @property
     def name(self):
-        if self.__information.get(gc.chstrName, None) is None:
-            self.__information[gc.chstrName] = ''
-            return ''
-        return self.__information[gc.chstrName]
+        return self.__field(gc.chstrName)
 
     @property
     def grade(self):
-        if self.__information.get(gc.chstrGrade, None) is None:
-            self.__information[gc.chstrGrade] = ''
-            return ''
-        return self.__information[gc.chstrGrade]
+        return self.__field(gc.chstrGrade)
 
     @property
     def studentID(self):
-        if self.__information.get(gc.chstrStudentID, None) is None:
-            self.__information[gc.chstrStudentID] = ''
-            return ''
-        return self.__information[gc.chstrStudentID]
+        return self.__field(gc.chstrStudentID)
 
     @property
     def politicalOutlook(self):
-        if self.__information.get(gc.chstrPoliticalOutlook, None) is None:
-            self.__information[gc.chstrPoliticalOutlook] = ''
-            return ''
-        return self.__information[gc.chstrPoliticalOutlook]
+        return self.__field(gc.chstrPoliticalOutlook)
 
     @property
     def academy(self):
-        if self.__information.get(gc.chstrAcademy, None) is None:
-            self.__information[gc.chstrAcademy] = ''
-            return ''
-        return self.__information[gc.chstrAcademy]
+        return self.__field(gc.chstrAcademy)
 
     @property
     def majors(self):
-        if self.__information.get(gc.chstrMajor, None) is None:
-            self.__information[gc.chstrMajor] = ''
-            return ''
-        return self.__information[gc.chstrMajor]
+        return self.__field(gc.chstrMajor)
 
     @property
     def phone(self):
-        if self.__information.get(gc.chstrPhone, None) is None:
-            self.__information[gc.chstrPhone] = ''
-            return ''
-        return self.__information[gc.chstrPhone]
+        return self.__field(gc.chstrPhone)
 
     @property
     def qq(self):
-        if self.__information.get(gc.chstrQQ, None) is None:
-            self.__information[gc.chstrQQ] = ''
-            return ''
-        return self.__information[gc.chstrQQ]
+        return self.__field(gc.chstrQQ)
 
     @property
     def position(self):
-        if self.__information.get(gc.chstrPosition, None) is None:
-            self.__information[gc.chstrPosition] = ''
-            return ''
-        return self.__information[gc.chstrPosition]
+        return self.__field(gc.chstrPosition)
 
     @property
     def Email(self):
-        if self.__information.get(gc.chstrEmail, None) is None:
-            self.__information[gc.chstrEmail] = ''
-            return ''
-        return self.__information[gc.chstrEmail]
+        return self.__field(gc.chstrEmail)
 
     @property
     def ethnicity(self):
-        if self.__information.get(gc.chstrEthnicity, None) is None:
-            self.__information[gc.chstrEthnicity] = ''
-            return ''
-        return self.__information[gc.chstrEthnicity]
+        return self.__field(gc.chstrEthnicity)
 
     @property
     def club(self):
-        if self.__information.get(gc.chstrClub, None) is None:
-            self.__information[gc.chstrClub] = ''
-            return ''
-        return self.__information[gc.chstrClub]
+        return self.__field(gc.chstrClub)
 
     @property
     def signPosition(self):
-        if self.__information.get(gc.chstrSignPosition, None) is None:
-            self.__information[gc.chstrSignPosition] = ''
-            return ''
-        return self.__information[gc.chstrSignPosition]
+        return self.__field(gc.chstrSignPosition)
 
     @property
     def gender(self):
-        if self.__information.get(gc.chstrGender, None) is None:
-            self.__information[gc.chstrGender] = ''
-            return ''
-        return self.__information[gc.chstrGender]
+        return self.__field(gc.chstrGender)
 
     @property
     def ifsign(self):
@@ -367,13 +354,13 @@ class DefPerson:
 
     @property
     def filepath(self):
-        """文件的相关路径"""
-        return copy.deepcopy(self.__filepaths)
+        """文件的相关路径（只读视图，需要修改时调用copy()）"""
+        return types.MappingProxyType({} if self.__filepaths is None else self.__filepaths)
 
     @property
     def savepath(self):
-        """保存文件的路径"""
-        return copy.deepcopy(self.__savepaths)
+        """保存文件的路径（只读快照，需要修改时调用copy()）"""
+        return FrozenList() if self.__savepaths is None else FrozenList(self.__savepaths)
 
     @ifcheck.setter
     def ifcheck(self, value: bool):
@@ -389,65 +376,66 @@ class DefPerson:
 
     @name.setter
     def name(self, value: str):
-        self.__information[gc.chstrName] = value
+        self.__set(gc.chstrName, value)
 
     @grade.setter
     def grade(self, value: str):
-        self.__information[gc.chstrGrade] = value
+        self.__set(gc.chstrGrade, value)
 
     @studentID.setter
     def studentID(self, value: str):
-        self.__information[gc.chstrStudentID] = value
+        self.__set(gc.chstrStudentID, value)
 
     @politicalOutlook.setter
     def politicalOutlook(self, value: str):
-        self.__information[gc.chstrPoliticalOutlook] = value
+        self.__set(gc.chstrPoliticalOutlook, value)
 
     @academy.setter
     def academy(self, value: str):
-        self.__information[gc.chstrAcademy] = value
+        self.__set(gc.chstrAcademy, value)
 
     @majors.setter
     def majors(self, value: str):
-        self.__information[gc.chstrMajor] = value
+        self.__set(gc.chstrMajor, value)
 
     @phone.setter
     def phone(self, value: str):
-        self.__information[gc.chstrPhone] = value
+        self.__set(gc.chstrPhone, value)
 
     @qq.setter
     def qq(self, value: str | int):
-        self.__information[gc.chstrQQ] = str(value)
+        self.__set(gc.chstrQQ, str(value))
 
     @position.setter
     def position(self, value: str):
-        self.__information[gc.chstrPosition] = str(value)
+        self.__set(gc.chstrPosition, str(value))
 
     @Email.setter
     def Email(self, value: str):
-        self.__information[gc.chstrEmail] = str(value)
+        self.__set(gc.chstrEmail, str(value))
 
     @ethnicity.setter
     def ethnicity(self, value: str):
-        self.__information[gc.chstrEthnicity] = str(value)
+        self.__set(gc.chstrEthnicity, str(value))
 
     @club.setter
     def club(self, value: str):
-        self.__information[gc.chstrClub] = str(value)
+        self.__set(gc.chstrClub, str(value))
 
     @signPosition.setter
     def signPosition(self, value: str):
-        self.__information[gc.chstrSignPosition] = str(value)
+        self.__set(gc.chstrSignPosition, str(value))
 
     @gender.setter
     def gender(self, value: str):
-        self.__information[gc.chstrGender] = str(value)
+        self.__set(gc.chstrGender, str(value))
 
     @filepath.setter
     def filepath(self, d: dict[str, str] = None):
         """补充文件路径（从哪里来）"""
         if isinstance(d, dict):
-            self.__filepaths.update(d.copy())
+            if self.__filepaths is None: self.__filepaths = {}
+            self.__filepaths.update(d)
         else:
             raise Exception('filepath 只能接受 dict 格式！！！')
 
@@ -455,9 +443,11 @@ class DefPerson:
     def savepath(self, value: str | list[str]):
         """补充保存路径"""
         if isinstance(value, str):
+            if self.__savepaths is None: self.__savepaths = []
             self.__savepaths.append(value)
         elif isinstance(value, list):
-            self.__savepaths.extend(copy.deepcopy(value))
+            if self.__savepaths is None: self.__savepaths = []
+            self.__savepaths.extend(value)
         else:
             raise Exception('savepath 只能接受 str 与 list[str] 格式！！！')
 
@@ -483,16 +473,18 @@ class DefPerson:
             if key == gc.chstrRegistrationMethod:
                 if self_key_value == '组织推荐': continue
                 if self_key_value != oinfo[key]:
-                    self.__information[key] = '组织推荐'
+                    self.__set(key, '组织推荐')
                 continue
             elif self_key_value != '' and self_key_value != 'None' and self_key_value != '-':
                 continue
             else:  # 为空
-                self.__information[key] = oinfo[key]
+                self.__set(key, oinfo[key])
                 continue
         self.__classname += other.classname
-        self.__filepaths.update(other.__filepaths.copy())
-        self.__filepaths = list(dict.fromkeys(self.__filepaths))  # 键去重方法
+        if other.__filepaths is not None:
+            # 以哈希值为键，同一文件只保留一份
+            if self.__filepaths is None: self.__filepaths = {}
+            self.__filepaths.update(other.__filepaths)
 
     def gen_classes(self):
         """产生班级列表"""
@@ -525,7 +517,7 @@ class DefPerson:
             safe_copytree)
         __sum = 0
         target_: list[str] = []
-        if len(self.__filepaths) == 0: return __sum
+        if self.__filepaths is None or len(self.__filepaths) == 0: return __sum
         if under_class_folder:
             classnames = self.gen_classes()
             for i in range(len(classnames)):
@@ -5,7 +5,7 @@ import time
 from .core import get_response
 
 
-def connect_progress_default(in_list: list[str] | None | int):
+def connect_progress_default(in_list: list[str] | tuple[str, ...] | None | int):
     """
     链接到默认进度条
     Args:
@@ -21,7 +21,7 @@ def connect_progress_default(in_list: list[str] | None | int):
                 return 'done'
             else:
                 raise ValueError(f'main thread response error : response = {response}')
-    if isinstance(in_list, list) and len(in_list) > 0:
+    if isinstance(in_list, list | tuple) and len(in_list) > 0:
         while True:
             response, shared_int = get_response(('request_progress_gauge_default', len(in_list)))
             if response == 'wait':
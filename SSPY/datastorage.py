@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 """数据储存类"""
-from copy import deepcopy
 from enum import Enum, unique
 from SSPY.fuzzy.search import search_recursive
+from SSPY.helperfunction import FrozenList, freeze
 
 
 @unique
@@ -69,16 +69,18 @@ class PDFDataStorage(BaseDataStorage):
 
     def __init__(self, path: str, sheets: list[list[list[str]]], paragraphs: list[list[str]]):
         super().__init__(path, datatype = DataType.pdf)
-        self.__paragraphs = paragraphs
-        self.__sheets = sheets
+        self.__paragraphs = freeze(paragraphs)
+        self.__sheets = freeze(sheets)
 
     @property
-    def paragraphs(self) -> list[list[str]]:
-        return deepcopy(self.__paragraphs)
+    def paragraphs(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__paragraphs
 
     @property
-    def sheets(self) -> list[list[list[str]]]:
-        return deepcopy(self.__sheets)
+    def sheets(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__sheets
 
     def find_value(self, target: str):
         likely: list[tuple] = []
@@ -99,11 +101,12 @@ class XLSXDataStorage(BaseDataStorage):
 
     def __init__(self, path: str, sheets: list[list[list[str]]]):
         super().__init__(path, DataType.pdf)
-        self.__sheets = sheets
+        self.__sheets = freeze(sheets)
 
     @property
-    def sheets(self) -> list[list[list[str]]]:
-        return deepcopy(self.__sheets)
+    def sheets(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__sheets
 
     def find_value(self, target: str):
         likely: list[tuple] = []
@@ -119,16 +122,18 @@ class XLSXDataStorage(BaseDataStorage):
 class DOCXDataStorage(BaseDataStorage):
     def __init__(self, path: str, sheets: list[list[list[str]]], paragraphs: list[str]):
         super().__init__(path, DataType.docx)
-        self.__paragraphs = paragraphs
-        self.__sheets = sheets
+        self.__paragraphs = freeze(paragraphs)
+        self.__sheets = freeze(sheets)
 
     @property
-    def paragraphs(self) -> list[str]:
-        return deepcopy(self.__paragraphs)
+    def paragraphs(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__paragraphs
 
     @property
-    def sheets(self) -> list[list[list[str]]]:
-        return deepcopy(self.__sheets)
+    def sheets(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__sheets
 
     def find_value(self, target: str):
         likely: list[tuple] = []
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""BK树，用于在编辑距离下查找相近的字符串"""
+from .search import levenshtein_distance
+
+
+class BKTree:
+    """
+    BK树（Burkhard-Keller树）
+    节点按照与父节点的距离挂载，查询时利用三角不等式剪枝，
+    查询“距离不超过k的全部条目”只需访问树的一小部分
+    """
+
+    def __init__(self, distance = levenshtein_distance):
+        """
+        Args:
+            distance:度量函数，必须满足三角不等式
+        """
+        self.__distance = distance
+        self.__root: list | None = None
+        """节点：[键, 条目列表, {距离: 子节点}]"""
+        self.__size = 0
+
+    def __len__(self):
+        return self.__size
+
+    def add(self, key: str, item = None):
+        """
+        添加一个条目，同键的条目挂在同一个节点上
+        Args:
+            key:参与距离计算的键
+            item:条目，默认为键本身
+        """
+        if item is None: item = key
+        self.__size += 1
+        if self.__root is None:
+            self.__root = [key, [item, ], {}]
+            return
+        node = self.__root
+        while True:
+            d = self.__distance(key, node[0])
+            if d == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(d, None)
+            if child is None:
+                node[2][d] = [key, [item, ], {}]
+                return
+            node = child
+
+    def query(self, key: str, k: int) -> list[tuple[int, object]]:
+        """
+        查找与key距离不超过k的全部条目
+        Args:
+            key:查找的键
+            k:最大距离
+        Returns:
+            (距离, 条目)组成的列表，条目为添加时的引用
+        """
+        found: list[tuple[int, object]] = []
+        if self.__root is None: return found
+        stack = [self.__root]
+        while len(stack) > 0:
+            node = stack.pop()
+            d = self.__distance(key, node[0])
+            if d <= k:
+                for item in node[1]:
+                    found.append((d, item))
+            for dc, child in node[2].items():
+                if d - k <= dc <= d + k:
+                    stack.append(child)
+        return found
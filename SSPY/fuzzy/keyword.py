@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""关键词解析：把任意表头字符串解析为标准键"""
+from collections import deque
+from functools import lru_cache
+from typing import Mapping
+
+
+class AhoCorasick:
+    """Aho-Corasick自动机，一次扫描找出文本中出现的全部模式串"""
+
+    def __init__(self, patterns: list[tuple[str, object]]):
+        """
+        Args:
+            patterns:(模式串, 值)组成的列表，空串会被忽略
+        """
+        self.__goto: list[dict[str, int]] = [{}]
+        """状态转移"""
+        self.__fail: list[int] = [0]
+        """失败指针"""
+        self.__out: list[list] = [[]]
+        """到达此状态时匹配到的值（含失败链上的值）"""
+        for pattern, value in patterns:
+            if not pattern: continue
+            state = 0
+            for ch in pattern:
+                nxt = self.__goto[state].get(ch, None)
+                if nxt is None:
+                    nxt = len(self.__goto)
+                    self.__goto.append({})
+                    self.__fail.append(0)
+                    self.__out.append([])
+                    self.__goto[state][ch] = nxt
+                state = nxt
+            self.__out[state].append(value)
+        self.__build()
+
+    def __build(self):
+        """按照广度优先建立失败指针"""
+        queue = deque(self.__goto[0].values())
+        while len(queue) > 0:
+            state = queue.popleft()
+            for ch, nxt in self.__goto[state].items():
+                queue.append(nxt)
+                f = self.__fail[state]
+                while f != 0 and ch not in self.__goto[f]:
+                    f = self.__fail[f]
+                f = self.__goto[f].get(ch, 0)
+                self.__fail[nxt] = f if f != nxt else 0
+                self.__out[nxt] = self.__out[nxt] + self.__out[self.__fail[nxt]]
+
+    def iter_values(self, text: str):
+        """依次产生text中出现的模式串的值"""
+        state = 0
+        goto = self.__goto
+        fail = self.__fail
+        for ch in text:
+            while state != 0 and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            yield from self.__out[state]
+
+
+class KeywordResolver:
+    """
+    标准键解析器，在导入时编译一次
+    查找顺序与逐项扫描相同：
+        1.完全相等
+        2.inkey_as_sub：输入键是某个关键词的子串
+        3.stdkey_as_sub：某个关键词是输入键的子串
+    同一阶段有多个标准键满足时，取关键词表中靠前的标准键
+    """
+
+    def __init__(self, table: Mapping[str, tuple[str, ...]], cache_size: int = 4096):
+        """
+        Args:
+            table:标准键 -> 关键词
+            cache_size:已解析字符串的缓存上限
+        """
+        self.__table = table
+        self.__keys: tuple[str, ...] = tuple(table.keys())
+        self.__exact: dict[str, str] = {}
+        """关键词 -> 标准键"""
+        self.__sub_index: dict[str, str] = {}
+        """关键词的任意非空子串 -> 标准键"""
+        patterns: list[tuple[str, int]] = []
+        for rank, k in enumerate(self.__keys):
+            for item in table[k]:
+                self.__exact.setdefault(item, k)
+                for i in range(len(item)):
+                    for j in range(i + 1, len(item) + 1):
+                        self.__sub_index.setdefault(item[i:j], k)
+                patterns.append((item, rank))
+        self.__automaton = AhoCorasick(patterns)
+        self.__cached = lru_cache(maxsize = cache_size)(self.__resolve)
+
+    def resolve(self, inkey: str, inkey_as_sub: bool = False, stdkey_as_sub: bool = False) -> str | None:
+        """
+        解析标准键
+        Args:
+            inkey:查找的键
+            inkey_as_sub:查找键作为字串匹配
+            stdkey_as_sub:标准键作为字串匹配
+        Returns:
+            标准键，未找到时返回None
+        """
+        if inkey is None or inkey == '': return None
+        if not isinstance(inkey, str):
+            return self.__resolve_scan(inkey, inkey_as_sub, stdkey_as_sub)
+        return self.__cached(inkey, bool(inkey_as_sub), bool(stdkey_as_sub))
+
+    def __resolve(self, inkey: str, inkey_as_sub: bool, stdkey_as_sub: bool) -> str | None:
+        k = self.__exact.get(inkey, None)
+        if k is not None: return k
+        if inkey_as_sub:
+            k = self.__sub_index.get(inkey, None)
+            if k is not None: return k
+        if stdkey_as_sub:
+            best = None
+            for rank in self.__automaton.iter_values(inkey):
+                if best is None or rank < best:
+                    best = rank
+                    if best == 0: break
+            if best is not None: return self.__keys[best]
+        return None
+
+    def __resolve_scan(self, inkey, inkey_as_sub: bool, stdkey_as_sub: bool) -> str | None:
+        """逐项扫描，用于非字符串的输入键"""
+        for k in self.__keys:
+            for item in self.__table[k]:
+                if inkey == item:
+                    return k
+        if inkey_as_sub:
+            for k in self.__keys:
+                for item in self.__table[k]:
+                    if inkey in item:
+                        return k
+        if stdkey_as_sub:
+            for k in self.__keys:
+                for item in self.__table[k]:
+                    if item in inkey:
+                        return k
+        return None
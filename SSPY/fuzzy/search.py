@@ -44,6 +44,64 @@ def levenshtein_distance(s: str, t: str) -> int:
     return dp[m][n]
 
 
+def levenshtein_within(s: str, t: str, k: int) -> int:
+    """
+    计算有上界的Levenshtein距离，只回答“距离是否不超过k”
+    只计算宽度为2k+1的对角带，某一行的最小值超过k时提前退出
+
+    Parameters:
+        s: 源字符串
+        t: 目标字符串
+        k: 距离上界
+
+    Returns:
+        距离不超过k时返回精确距离，否则返回k+1
+    """
+    if k < 0: return 0 if s == t else k + 1
+    if s == t: return 0
+    m = len(s)
+    n = len(t)
+    big = k + 1
+    # 长度差本身就是距离的下界
+    if abs(m - n) > k: return big
+    # 去掉公共前缀与公共后缀，不影响距离
+    start = 0
+    while start < m and start < n and s[start] == t[start]:
+        start += 1
+    while m > start and n > start and s[m - 1] == t[n - 1]:
+        m -= 1
+        n -= 1
+    s = s[start:m]
+    t = t[start:n]
+    m -= start
+    n -= start
+    if m > n:
+        s, t = t, s
+        m, n = n, m
+    if m == 0: return n if n <= k else big
+
+    prev = [j if j <= k else big for j in range(n + 1)]
+    cur = [big] * (n + 1)
+    for i in range(1, m + 1):
+        lo = i - k if i - k > 1 else 1
+        hi = i + k if i + k < n else n
+        cur[0] = i if i <= k else big
+        if lo > 1: cur[lo - 1] = big  # 带左侧的单元格
+        row_min = cur[0] if lo == 1 else big
+        si = s[i - 1]
+        for j in range(lo, hi + 1):
+            v = prev[j - 1] if si == t[j - 1] else prev[j - 1] + 1
+            if prev[j] + 1 < v: v = prev[j] + 1
+            if cur[j - 1] + 1 < v: v = cur[j - 1] + 1
+            if v > big: v = big
+            cur[j] = v
+            if v < row_min: row_min = v
+        if hi < n: cur[hi + 1] = big  # 带右侧的单元格
+        if row_min > k: return big
+        prev, cur = cur, prev
+    return prev[n] if prev[n] <= k else big
+
+
 @unique
 class LEVEL(Enum):
     """匹配度"""
@@ -73,16 +131,124 @@ class Priority(Enum):
     """相似度优先"""
 
 
-def match_by(a: str, b: str, level = LEVEL.Perfect):
+def match_by(a: str, b: str, level = LEVEL.Perfect, memo: dict | None = None):
+    """
+    a与b的编辑距离是否不超过level
+    Args:
+        a:字符串
+        b:字符串
+        level:匹配度等级
+        memo:距离缓存，以(a, b)为键记录有上界的距离，同一个缓存只能用于同一个level
+    """
     if isinstance(a, str) and isinstance(b, str):
         if level == LEVEL.Perfect:
             return a == b
-        distance = levenshtein_distance(a, b)
         mp = level.value
+        if memo is not None:
+            distance = memo.get((a, b), None)
+            if distance is not None:
+                return distance <= mp
+        distance = levenshtein_within(a, b, mp)
+        if memo is not None: memo[(a, b)] = distance
         return distance <= mp
     return False
 
 
+class EncodedStrings:
+    """
+    预编码的字符串组：按码点编码为填充后的int32矩阵，
+    编码一次后可以在多次distances查询之间复用
+    """
+
+    def __init__(self, strings: list[str] | tuple[str, ...]):
+        """
+        Args:
+            strings:候选字符串
+        """
+        import numpy as np
+        self.__strings = tuple(strings)
+        n = len(self.__strings)
+        self.__lengths = np.fromiter((len(x) for x in self.__strings), dtype = np.int32, count = n)
+        width = int(self.__lengths.max()) if n > 0 else 0
+        # 填充值-1不会与任何码点相等
+        self.__codes = np.full((n, width), -1, dtype = np.int32)
+        if n > 0 and width > 0:
+            flat = np.frombuffer(''.join(self.__strings).encode('utf-32-le'), dtype = '<u4')
+            mask = np.arange(width, dtype = np.int32) < self.__lengths[:, None]
+            self.__codes[mask] = flat
+        self.__codes.flags.writeable = False
+        self.__lengths.flags.writeable = False
+
+    def __len__(self):
+        return len(self.__strings)
+
+    @property
+    def strings(self) -> tuple[str, ...]:
+        """原始字符串"""
+        return self.__strings
+
+    @property
+    def codes(self):
+        """码点矩阵，形状为(候选数, 最大长度)"""
+        return self.__codes
+
+    @property
+    def lengths(self):
+        """每个候选的长度"""
+        return self.__lengths
+
+
+def distances(target: str, candidates: 'EncodedStrings | list[str] | tuple[str, ...]'):
+    """
+    计算target与每一个候选的Levenshtein距离，
+    DP按行推进，每一行对全部候选做向量化计算
+    Args:
+        target:目标字符串
+        candidates:候选字符串，或预编码的EncodedStrings
+    Returns:
+        np.ndarray[int32]，第i个元素为target与第i个候选的距离
+    """
+    import numpy as np
+    enc = candidates if isinstance(candidates, EncodedStrings) else EncodedStrings(candidates)
+    codes = enc.codes
+    lengths = enc.lengths
+    n, width = codes.shape
+    m = len(target)
+    if n == 0: return np.zeros(0, dtype = np.int32)
+    if width == 0 or m == 0: return np.abs(lengths - m).astype(np.int32)
+
+    tcodes = np.frombuffer(target.encode('utf-32-le'), dtype = '<u4').astype(np.int32)
+    cols = np.arange(width + 1, dtype = np.int32)
+    prev = np.broadcast_to(cols, (n, width + 1)).copy()
+    tmp = np.empty((n, width + 1), dtype = np.int32)
+    for i in range(1, m + 1):
+        cost = (codes != tcodes[i - 1]).view(np.int8)
+        tmp[:, 0] = i
+        # 删除与替换
+        np.minimum(prev[:, 1:] + 1, prev[:, :-1] + cost, out = tmp[:, 1:])
+        # 插入：cur[j] = min(tmp[j], cur[j-1] + 1)，等价于 tmp - j 的前缀最小值再加 j
+        tmp -= cols
+        np.minimum.accumulate(tmp, axis = 1, out = prev)
+        prev += cols
+    return prev[np.arange(n), lengths]
+
+
+def match_many(
+    target: str,
+    candidates: 'EncodedStrings | list[str] | tuple[str, ...]',
+    level = LEVEL.Perfect):
+    """
+    批量版本的match_by
+    Returns:
+        np.ndarray[bool]，第i个元素为match_by(target, 第i个候选, level)
+    """
+    import numpy as np
+    enc = candidates if isinstance(candidates, EncodedStrings) else EncodedStrings(candidates)
+    if level == LEVEL.Perfect:
+        return np.fromiter((x == target for x in enc.strings), dtype = bool, count = len(enc))
+    return distances(target, enc) <= level.value
+
+
 def searched_recursive(
     target: str,
     lib: tuple | list | str | dict,
@@ -129,7 +295,8 @@ def search_recursive(
     lib: tuple | list | str | dict,
     level = LEVEL.Perfect,
     target_as_sub: bool = False,
-    lib_as_sub: bool = False):
+    lib_as_sub: bool = False,
+    memo: dict | None = None):
     """
     对任意列表进行递归搜索，支持模糊
     Args:
@@ -138,6 +305,7 @@ def search_recursive(
         level:搜索匹配度等级
         target_as_sub:将目标视作字串搜索
         lib_as_sub:将库字符视作字串搜索
+        memo:距离缓存，见match_by
     Returns:
         满足条件搜索值组成的一个列表
     """
@@ -145,14 +313,16 @@ def search_recursive(
     if target is None: return ms
     if not isinstance(target, str): return ms
     if isinstance(lib, list | tuple):
+        flat = _search_flat(target, lib, level, target_as_sub, lib_as_sub, memo)
+        if flat is not None: return flat
         for r in lib:
-            ms.extend(search_recursive(target, r, level, target_as_sub, lib_as_sub))
+            ms.extend(search_recursive(target, r, level, target_as_sub, lib_as_sub, memo))
     elif isinstance(lib, dict):
         for k in lib.keys():
-            ms.extend(search_recursive(target, k, level, target_as_sub, lib_as_sub))
-            ms.extend(search_recursive(target, lib[k], level, target_as_sub, lib_as_sub))
+            ms.extend(search_recursive(target, k, level, target_as_sub, lib_as_sub, memo))
+            ms.extend(search_recursive(target, lib[k], level, target_as_sub, lib_as_sub, memo))
     elif isinstance(lib, str):
-        if match_by(target, lib, level): ms.append(lib)
+        if match_by(target, lib, level, memo): ms.append(lib)
         if target_as_sub:
             if target in lib: ms.append(lib)
         if lib_as_sub:
@@ -160,6 +330,40 @@ def search_recursive(
     return ms
 
 
+_BATCH_MIN_SIZE = 64
+"""扁平字符串列表达到此长度时使用批量距离计算"""
+
+
+def _search_flat(
+    target: str,
+    lib: tuple | list,
+    level,
+    target_as_sub: bool,
+    lib_as_sub: bool,
+    memo: dict | None):
+    """
+    search_recursive在扁平字符串列表上的批量实现，结果与逐项递归相同
+    Returns:
+        不适用批量计算时返回None
+    """
+    if level == LEVEL.Perfect or len(lib) < _BATCH_MIN_SIZE: return None
+    if not all(isinstance(r, str) for r in lib): return None
+    try:
+        dis = distances(target, lib).tolist()
+    except ImportError:
+        return None
+    ms: list[str] = []
+    mp = level.value
+    for r, d in zip(lib, dis):
+        if memo is not None: memo[(target, r)] = d
+        if d <= mp: ms.append(r)
+        if target_as_sub:
+            if target in r: ms.append(r)
+        if lib_as_sub:
+            if r in target: ms.append(r)
+    return ms
+
+
 def search_auto(
     target: str,
     lib: tuple | list | str,
@@ -182,7 +386,9 @@ def search_auto(
         3.lib_as_sub
         3.fuzzy
     """
-    orgList = search_recursive(target, lib, level, target_as_sub, lib_as_sub)  # 解析出的原始序列
+    memo: dict[tuple[str, str], int] = {}
+    """本次调用的距离缓存"""
+    orgList = search_recursive(target, lib, level, target_as_sub, lib_as_sub, memo)  # 解析出的原始序列
 
     if len(orgList) <= 1: return orgList
 
@@ -219,7 +425,11 @@ def search_auto(
     elif level != LEVEL.Perfect:
         dpMap: list[tuple[str, int]] = []
         for item in orgList:
-            dpMap.append((item, levenshtein_distance(target, item)))
+            # 模糊匹配成功的项目在缓存中的距离是精确的
+            distance = memo.get((target, item), None)
+            if distance is None or distance > level.value:
+                distance = levenshtein_distance(target, item)
+            dpMap.append((item, distance))
         sorteddpMap = sorted(dpMap, key = lambda x: x[1])
         for item in sorteddpMap:
             sortedList.append(item[0])
@@ -1,4 +1,43 @@
 # -*- coding: utf-8 -*-
+from types import MappingProxyType
+
+
+class FrozenList(tuple):
+    """
+    只读的嵌套序列快照，访问器直接返回它而不做深拷贝
+    需要修改时调用copy()得到可修改的list
+    """
+    __slots__ = ()
+
+    def copy(self) -> list:
+        """可修改的深拷贝"""
+        return thaw(self)
+
+
+def freeze(obj):
+    """
+    将嵌套的list/tuple/dict转换为只读快照，其余对象原样返回
+    已经是FrozenList的对象不会再次复制
+    """
+    if isinstance(obj, FrozenList | str):
+        return obj
+    if isinstance(obj, list | tuple):
+        return FrozenList(freeze(x) for x in obj)
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    return obj
+
+
+def thaw(obj):
+    """将freeze产生的只读快照转换回可修改的list/dict"""
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, list | tuple):
+        return [thaw(x) for x in obj]
+    if isinstance(obj, dict | MappingProxyType):
+        return {k: thaw(v) for k, v in obj.items()}
+    return obj
+
 
 def clean_enter(in_list: list | tuple | str, inst_None) -> list | str:
     """
@@ -54,48 +93,97 @@ def _exit(in_flag: Event | None) -> bool:
     return False
 
 
+def _include_index(exc: list[int] | None, len_max: int) -> list[int]:
+    """预处理，产生参与排序的行号或列号"""
+    exc = set(exc) if isinstance(exc, list | tuple | set) else ()
+    return [i for i in range(len_max) if i not in exc]
+
+
+def sort_rows(
+    in_table: list[list[str]],
+    keys = None,
+    reverse: bool | list[bool] = False,
+    exclude_rows: list[int] = None,
+    exclude_cols: list[int] = None, ):
+    """
+    按键函数对一个矩形表格原地排序（稳定排序，O(n log n)，整行移动而非逐格交换）
+    Args:
+        in_table:输入的表格
+        keys:键函数或键函数的list，依次作为第一、第二……排序键，接收整行；None时按整行比较
+        reverse:是否降序，可为每个键分别指定
+        exclude_rows:排除的行，保持原位
+        exclude_cols:排除的列，单元格保持原位（键函数不应依赖这些列）
+    """
+    if in_table is None or len(in_table) == 0: return
+    if keys is None: keys = [lambda r: r]
+    elif callable(keys): keys = [keys]
+    if isinstance(reverse, bool): reverse = [reverse] * len(keys)
+    if len(reverse) != len(keys):
+        raise ValueError('reverse的长度必须与keys一致')
+
+    include_rows = _include_index(exclude_rows, len(in_table))
+    """参与排序的行号"""
+    rows = [in_table[i] for i in include_rows]
+    order = list(range(len(rows)))
+    # 由次要键到主要键依次稳定排序，各键可分别指定方向
+    for key, rev in zip(reversed(keys), reversed(reverse)):
+        order.sort(key = lambda k: key(rows[k]), reverse = rev)
+
+    len_cols = len(in_table[0])
+    exc_cols = sorted(set(range(len_cols)) - set(_include_index(exclude_cols, len_cols)))
+    """排除的列号"""
+    for n, (i, k) in enumerate(zip(include_rows, order)):
+        if len(exc_cols) == 0 or n == k:
+            in_table[i] = rows[k]
+            continue
+        row = list(rows[k])
+        for c in exc_cols:
+            row[c] = rows[n][c]
+        in_table[i] = row
+
+
+def compare_to_key(CompareMethod):
+    """
+    将sort_table风格的比较方法（返回True表示a应排在b之后）转换为sort_rows可用的键函数
+    比较方法须为严格弱序；相等的行保持原有顺序
+    """
+    from functools import cmp_to_key
+    return cmp_to_key(lambda a, b: 1 if CompareMethod(a, b) else -1 if CompareMethod(b, a) else 0)
+
+
 def sort_table(
     in_table: list[list[str]],
     CompareMethod = lambda a, b: a[0] < b[0],
     exclude_rows: list[int] = None,
     exclude_cols: list[int] = None, ):
     """
-    对一个矩形表格进行排序
+    对一个矩形表格进行排序（兼容旧接口，与原交换排序结果逐格一致）
+    比较方法只读取参与排序的列时，优先使用sort_rows
     Args:
         in_table:输入的表格
         CompareMethod:自定义的比较方法（lambda函数）
         exclude_rows:排除的行
         exclude_cols:排除的列
     """
-
-    def pre(exc: list[int], len_max: int):
-        """预处理，产生参与比较的行与列"""
-        inc: list[int] = []
-        for i in range(len_max):
-            if isinstance(exc, list) and (i in exc):
-                continue
-            inc.append(i)
-        return inc
-
     len_rows = len(in_table)
     """行数"""
     len_cols = len(in_table[0])
     """列数"""
-    include_rows = pre(exclude_rows, len_rows)
+    include_rows = _include_index(exclude_rows, len_rows)
     """参与比较的行号"""
-    include_cols = pre(exclude_cols, len_cols)
-    """参与比较的列号"""
+    exc_cols = sorted(set(range(len_cols)) - set(_include_index(exclude_cols, len_cols)))
+    """排除的列号，交换整行后将其换回原位"""
 
     # 启动比较程序
-    for i in include_rows:
-        for j in include_rows:
-            if i >= j: continue
+    for n, i in enumerate(include_rows):
+        for j in include_rows[n + 1:]:
             if CompareMethod(in_table[i], in_table[j]):
-                for k in include_cols:
+                in_table[j], in_table[i] = in_table[i], in_table[j]
+                for k in exc_cols:
                     in_table[j][k], in_table[i][k] = in_table[i][k], in_table[j][k]
 
 
-def trans_list_to_str(in_list: list[str]) -> str:
+def trans_list_to_str(in_list: list[str] | tuple[str, ...]) -> str:
     """
     将输入的in_list转换为str
     Args:
@@ -103,7 +191,7 @@ def trans_list_to_str(in_list: list[str]) -> str:
         auto_enter:自动换行
     """
     out_str = ''
-    if not isinstance(in_list, list): return out_str
+    if not isinstance(in_list, list | tuple): return out_str
     len_l = len(in_list)
     if len_l == 0: return out_str
     for i in range(len_l):
@@ -1,47 +1,152 @@
 """pdf解析"""
+from typing import Callable
+
 from SSPY.helperfunction import clean_space
 from SSPY.myff.document.base import ParasSheets
 
 
+class PdfStream:
+    """
+    只打开一次pdf，在同一个页面循环中提取表格与文字
+    表格优先使用PyMuPDF的page.find_tables()；该页识别出错，或没有识别出表格但页面上有线条或文字时，
+    改用pdfplumber（首次需要时打开）
+    表格单元格与pdfplumber的extract_tables()相同，空单元格为None；文字为各span去除空格后的文本
+    """
+
+    def __init__(
+        self,
+        path: str,
+        tables: bool = True,
+        text: bool = True,
+        stop: Callable[[list[list[list[str | None]]]], bool] = None,
+        keywords: list[str] = None,
+        neighbors: int = 0):
+        """
+        Args:
+            path:pdf文件路径
+            tables:是否提取表格
+            text:是否提取文字
+            stop:每页表格提取完成时以该页的表格调用，返回真时停止，之后的页面不再提取
+            keywords:页面筛选关键词，先用PyMuPDF的文字提取找到可能含有任一关键词的页面，只在这些页面上识别表格；
+                     页面文字（忽略空白）含有关键词，或有至少两个字的单词是关键词的一部分；
+                     没有页面符合时识别全部页面，None为全部页面
+            neighbors:同时识别关键词页面前后各neighbors页的表格，用于跨页的表格
+        """
+        self.tables: list[list[list[str | None]]] = []
+        """全部表格，按页面顺序"""
+        self.pages: list[list[str]] = []
+        """每页的文字"""
+        self.page_count = 0
+        """实际处理的页数"""
+        self.table_pages: list[int] = []
+        """识别了表格的页码（从0开始）"""
+        self.fallback_pages: list[int] = []
+        """使用pdfplumber提取表格的页码（从0开始）"""
+        self.__path = path
+        self.__plumber = None
+        import fitz  # PyMuPDF
+        if hasattr(fitz, 'no_recommend_layout'): fitz.no_recommend_layout()  # 不打印find_tables的版面分析推荐
+        try:
+            with fitz.open(path) as doc:
+                wanted = None
+                if tables and keywords:
+                    wanted = self.__keyword_pages(doc, keywords, neighbors) or None
+                # 不提取文字时只需要访问筛选出的页面
+                numbers = range(len(doc)) if wanted is None or text else sorted(wanted)
+                for number in numbers:
+                    page = doc[number]
+                    self.page_count += 1
+                    if text: self.pages.append(self.__page_text(page))
+                    if not tables or (wanted is not None and number not in wanted): continue
+                    self.table_pages.append(number)
+                    page_tables = self.__page_tables(page)
+                    self.tables.extend(page_tables)
+                    if stop is not None and stop(page_tables): break
+        finally:
+            if self.__plumber is not None: self.__plumber.close()
+
+    @staticmethod
+    def __keyword_pages(doc, keywords: list[str], neighbors: int) -> set[int]:
+        """
+        可能含有任一关键词的页面及其前后neighbors页的页码
+        单元格是关键词的一部分（如"岗位"之于"应聘岗位"）时get_sheet同样视为匹配，因此单词也要与关键词比较；
+        单个字不算，表头常把字隔开写（"岗 位"），它们已由去除空白后的页面文字覆盖
+        """
+        keywords = [''.join(k.split()) for k in keywords]
+        keywords = [k for k in keywords if k]
+        pages: set[int] = set()
+        for page in doc:
+            words = [w[4] for w in page.get_text('words')]
+            page_text = ''.join(''.join(words).split())
+            parts = [w for w in words if len(w) >= 2]
+            if any(k in page_text or any(w in k for w in parts) for k in keywords):
+                pages.update(range(max(page.number - neighbors, 0), min(page.number + neighbors + 1, len(doc))))
+        return pages
+
+    @staticmethod
+    def __page_text(page) -> list[str]:
+        import fitz
+        p_text: list[str] = []
+        # 只需要文字块，不读取图片
+        blocks_dict = page.get_text('dict', flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES)
+        for block in blocks_dict['blocks']:
+            if block['type'] == 0:
+                for line in block['lines']:
+                    for span in line['spans']:
+                        p_text.append(clean_space(span['text'], ''))
+        return p_text
+
+    @staticmethod
+    def __has_content(page) -> bool:
+        """页面上是否有文字或矢量线条（可能构成表格）"""
+        if page.get_text('text').strip(): return True
+        drawings = page.get_cdrawings() if hasattr(page, 'get_cdrawings') else page.get_drawings()
+        return len(drawings) > 0
+
+    def __page_tables(self, page) -> list[list[list[str | None]]]:
+        try:
+            tables = [t.extract() for t in page.find_tables().tables]
+            if tables or not self.__has_content(page): return tables
+        except Exception:
+            # 旧版本PyMuPDF没有find_tables，或该页的表格识别出错
+            pass
+        # PyMuPDF没有得到表格的页面交给pdfplumber再识别一次
+        self.fallback_pages.append(page.number)
+        if self.__plumber is None:
+            import pdfplumber
+            self.__plumber = pdfplumber.open(self.__path)
+        return self.__plumber.pages[page.number].extract_tables()
+
+
 class PdfParser:
-    """解析Pdf的工具"""
+    """解析Pdf的工具，文件只解析一次"""
 
     def __init__(self, path):
         self.__path = path
+        self.__stream: PdfStream | None = None
+        self.__error: Exception | None = None
+
+    def __load(self) -> PdfStream | None:
+        if self.__stream is None and self.__error is None:
+            try:
+                self.__stream = PdfStream(self.__path)
+            except Exception as e:
+                self.__error = e
+                print(f'pdf文件"{self.__path}"解析失败：{e}，已跳过...')
+        return self.__stream
 
     @property
     def sheets(self):
         """表格"""
-        import pdfplumber
-        with pdfplumber.open(self.__path) as mypdf:
-            if len(mypdf.pages) <= 0: return False
-            tables = []
-            for page in mypdf.pages:
-                tables.extend(page.extract_tables())
-            return tables
+        stream = self.__load()
+        if stream is None: return []
+        return stream.tables
 
     @property
     def paragraphs(self):
-        import fitz  # PyMuPDF
-        try:
-            pdf = fitz.open(self.__path)
-            para: list[str] = []
-            for page_num in range(len(pdf)):
-                p_text: list[str] = []
-                page = pdf.load_page(page_num)
-                # 关键步骤：以字典形式获取页面中的所有块信息
-                blocks_dict = page.get_text("dict")
-                for block in blocks_dict["blocks"]:
-                    if block["type"] == 0:
-                        # 遍历块中的每一行和每一个span
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                p_text.append(clean_space(span["text"], ''))
-                para.extend(p_text)
-            return para
-        except Exception as e:
-            print(f'pdf文件"{self.__path}"解析失败：{e}，已跳过...')
-            return []
+        stream = self.__load()
+        if stream is None: return []
+        return [t for page in stream.pages for t in page]
 
 
 class Pdf(ParasSheets):
@@ -1,103 +1,285 @@
 """word文件docx"""
+import posixpath
 import zipfile
-from typing import List
+import zlib
+from typing import Callable, List
+from xml.etree.ElementTree import iterparse, ParseError, fromstring
 from SSPY.communitor import mprint
 
-import xml.etree.ElementTree as ET
-
 from .base import ParasSheets
 
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY = _W + 'body'
+_P = _W + 'p'
+_R = _W + 'r'
+_T = _W + 't'
+_HYPERLINK = _W + 'hyperlink'
+_TAB = _W + 'tab'
+_PTAB = _W + 'ptab'
+_BR = _W + 'br'
+_CR = _W + 'cr'
+_NOBREAKHYPHEN = _W + 'noBreakHyphen'
+_TBL = _W + 'tbl'
+_TR = _W + 'tr'
+_TC = _W + 'tc'
+_TRPR = _W + 'trPr'
+_TCPR = _W + 'tcPr'
+_GRIDBEFORE = _W + 'gridBefore'
+_GRIDSPAN = _W + 'gridSpan'
+_VMERGE = _W + 'vMerge'
+_VAL = _W + 'val'
+_TYPE = _W + 'type'
+
+_NS_CT = '{http://schemas.openxmlformats.org/package/2006/content-types}'
+_REL_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_WORD_CONTENT_TYPES = (
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml',
+    'application/vnd.ms-word.document.macroEnabled.main+xml',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml',
+    'application/vnd.ms-word.template.macroEnabledTemplate.main+xml',
+)
+"""主文档部件可接受的内容类型"""
+
+
+def _run_text(r) -> str:
+    """w:r的文本，与python-docx的Run.text相同：制表符为\\t，换行为\\n"""
+    parts: list[str] = []
+    for c in r:
+        tag = c.tag
+        if tag == _T:
+            if c.text: parts.append(c.text)
+        elif tag == _TAB or tag == _PTAB:
+            parts.append('\t')
+        elif tag == _BR:
+            if c.get(_TYPE, 'textWrapping') == 'textWrapping': parts.append('\n')
+        elif tag == _CR:
+            parts.append('\n')
+        elif tag == _NOBREAKHYPHEN:
+            parts.append('-')
+    return ''.join(parts)
+
+
+def _paragraph_text(p) -> str:
+    """w:p的文本，只取直接的w:r与w:hyperlink中的w:r，与python-docx的Paragraph.text相同"""
+    parts: list[str] = []
+    for c in p:
+        if c.tag == _R:
+            parts.append(_run_text(c))
+        elif c.tag == _HYPERLINK:
+            for r in c:
+                if r.tag == _R: parts.append(_run_text(r))
+    return ''.join(parts)
+
+
+def _main_part(z: zipfile.ZipFile, path) -> str:
+    """按照_rels/.rels找到主文档部件，并确认其为word文档"""
+    name = 'word/document.xml'
+    try:
+        for rel in fromstring(z.read('_rels/.rels')):
+            if rel.get('Type') == _REL_OFFICE_DOCUMENT and rel.get('Target'):
+                name = posixpath.normpath(posixpath.join('/', rel.get('Target'))).lstrip('/')
+                break
+    except KeyError:
+        pass
+    try:
+        types = fromstring(z.read('[Content_Types].xml'))
+    except KeyError:
+        return name
+    ct = None
+    for o in types.iter(_NS_CT + 'Override'):
+        if o.get('PartName', '').lstrip('/') == name:
+            ct = o.get('ContentType')
+            break
+    if ct is not None and ct not in _WORD_CONTENT_TYPES:
+        raise ValueError(f"file '{path}' is not a Word file, content type is '{ct}'")
+    return name
+
+
+class _Table:
+    """解析中的表格"""
+    __slots__ = ('element', 'slot', 'rows', 'tr', 'row', 'offset', 'above', 'grid', 'tc', 'cell')
+
+    def __init__(self, element, slot: int):
+        self.element = element
+        self.slot = slot
+        """在结果中的位置，按照表格开始的顺序"""
+        self.rows: list[list[str]] = []
+        self.tr = None
+        self.row: list[str] = []
+        self.offset = 0
+        """当前单元格在布局网格中的列号"""
+        self.above: dict[int, str] = {}
+        """上一行：网格列号 -> 单元格文本（纵向合并时为合并起点的文本）"""
+        self.grid: dict[int, str] = {}
+        self.tc = None
+        self.cell: list[str] = []
+
+
+class DocxStream:
+    """
+    单次流式解析docx正文：从压缩包中iterparse主文档，同时得到表格与段落，元素处理完即丢弃
+    单元格文本与python-docx相同（直接段落以\\n连接），横向合并（gridSpan）的单元格只出现一次，
+    纵向合并（vMerge）的后续单元格取合并起点的文本
+    只读取_rels/.rels与主文档部件，其他.rels中的幽灵引用（指向不存在的部件）与损坏的其他entry不影响解析，
+    因此不需要像python-docx那样先修复文件
+    """
+
+    def __init__(self, source, stop: Callable[[list[list[str]]], bool] = None):
+        """
+        Args:
+            source:docx文件路径或二进制文件对象
+            stop:每个正文表格解析完成时调用，返回真时停止解析，之后的表格与段落不再读取
+        """
+        self.__stop = stop
+        self.stopped = False
+        """是否提前停止"""
+        self.tables: list[tuple[bool, list[list[str]]]] = []
+        """(是否为正文中的表格, 表格)，按照表格开始的顺序，包含嵌套表格"""
+        self.paragraphs: list[tuple[bool, str]] = []
+        """(是否为正文中的段落, 文本)，按照段落结束的顺序，包含表格内的段落"""
+        with zipfile.ZipFile(source, 'r') as z:
+            with z.open(_main_part(z, source)) as f:
+                self.__parse(f)
+
+    def __parse(self, f):
+        tables = self.tables
+        paragraphs = self.paragraphs
+        stack: list = []
+        """打开的元素"""
+        open_tables: list[_Table] = []
+        for event, el in iterparse(f, events = ('start', 'end')):
+            tag = el.tag
+            if event == 'start':
+                if tag == _TBL:
+                    open_tables.append(_Table(el, len(tables)))
+                    tables.append((stack[-1].tag == _BODY, []))
+                elif open_tables:
+                    t = open_tables[-1]
+                    if tag == _TR and stack[-1] is t.element:
+                        t.tr = el
+                        t.row = []
+                        t.grid = {}
+                        t.offset = 0
+                    elif tag == _TC and t.tr is not None and stack[-1] is t.tr:
+                        t.tc = el
+                        t.cell = []
+                stack.append(el)
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if tag == _P:
+                text = _paragraph_text(el)
+                paragraphs.append((parent is not None and parent.tag == _BODY, text))
+                if open_tables and parent is open_tables[-1].tc:
+                    open_tables[-1].cell.append(text)
+            elif tag == _TRPR:
+                if open_tables and parent is open_tables[-1].tr:
+                    gb = el.find(_GRIDBEFORE)
+                    open_tables[-1].offset = int(gb.get(_VAL, 0)) if gb is not None else 0
+            elif tag == _TC:
+                t = open_tables[-1] if open_tables else None
+                if t is not None and el is t.tc:
+                    span, merge = 1, None
+                    pr = el.find(_TCPR)
+                    if pr is not None:
+                        gs = pr.find(_GRIDSPAN)
+                        if gs is not None: span = max(int(gs.get(_VAL, 1)), 1)
+                        vm = pr.find(_VMERGE)
+                        if vm is not None: merge = vm.get(_VAL, 'continue')
+                    if merge == 'continue':
+                        text = t.above.get(t.offset, '')
+                    else:
+                        text = '\n'.join(t.cell).strip()
+                    t.grid[t.offset] = text
+                    t.row.append(text)
+                    t.offset += span
+                    t.tc = None
+            elif tag == _TR:
+                t = open_tables[-1] if open_tables else None
+                if t is not None and el is t.tr:
+                    t.rows.append(t.row)
+                    t.above = t.grid
+                    t.tr = None
+            elif tag == _TBL:
+                t = open_tables.pop()
+                top = tables[t.slot][0]
+                tables[t.slot] = (top, t.rows)
+                if top and self.__stop is not None and self.__stop(t.rows):
+                    self.stopped = True
+                    return
+            elif parent is None or parent.tag != _BODY:
+                continue  # 其他元素由所在的段落或单元格读取
+            # 处理完的元素从父元素中移除，内存只与最大的块级元素有关
+            if parent is not None:
+                parent.remove(el)
+
+    def body_tables(self) -> list[list[list[str]]]:
+        """正文中的表格（不含嵌套表格），与python-docx的Document.tables相同"""
+        return [rows for top, rows in self.tables if top]
+
+    def body_paragraphs(self) -> list[str]:
+        """正文中的段落，与python-docx的Document.paragraphs相同"""
+        return [text for top, text in self.paragraphs if top]
+
 
 class DirectDocxParser:
-    """直接解析docx的XML结构，避免依赖python-docx，解析产生自cpp原始逻辑"""
+    """
+    直接解析docx的XML结构，避免依赖python-docx，解析产生自cpp原始逻辑
+    主文档只读取并解析一次，表格与段落在同一棵树上提取；
+    单元格文本为其中全部段落（含嵌套表格）以空格连接，与DocxStream的python-docx语义不同
+    """
 
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.namespace = {
-            'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
-            'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
-        }
-        self.__xml_content: bytes = b''
+        self.__sheets: List[List[List[str]]] = []
+        self.__paragraphs: List[str] = []
         self.__loader()
 
     def __loader(self):
         """加载方法"""
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-                with zip_ref.open('word/document.xml') as xml_file:
-                    self.__xml_content = xml_file.read()
-        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+            with zipfile.ZipFile(self.file_path, 'r') as z:
+                root = fromstring(z.read(_main_part(z, self.file_path)))
+        except (zipfile.BadZipFile, zlib.error, KeyError, ValueError, ParseError) as e:
             mprint(f"XML解析错误: {e}", 'red', False)
+            return
+        self.__sheets = self.__parse_tables(root)
+        self.__paragraphs = self.__parse_paragraphs(root)
 
-    @property
-    def sheets(self) -> List[List[List[str]]]:
-        """直接从document.xml解析表格数据"""
-        return self._parse_xml_tables(self.__xml_content)
+    @staticmethod
+    def __paragraph_text(p) -> str:
+        return ''.join(t.text for t in p.iter(_T) if t.text)
 
-    def _parse_xml_tables(self, xml_content: bytes) -> List[List[List[str]]]:
-        """解析XML中的表格结构"""
-        root = ET.fromstring(xml_content)
+    @staticmethod
+    def __parse_tables(root) -> List[List[List[str]]]:
+        """全部表格（含嵌套表格），只保留非空的行与表格"""
         all_tables = []
-
-        # 查找所有表格元素
-        for tbl_elem in root.findall('.//w:tbl', self.namespace):
+        for tbl in root.iter(_TBL):
             table_data = []
-
-            # 处理每一行
-            for tr_elem in tbl_elem.findall('w:tr', self.namespace):
+            for tr in tbl.findall(_TR):
                 row_data = []
-
-                # 处理每个单元格
-                for tc_elem in tr_elem.findall('w:tc', self.namespace):
-                    cell_text = self._extract_cell_text(tc_elem)
-                    row_data.append(cell_text.strip())
-
-                if row_data:  # 只添加非空行
+                for tc in tr.findall(_TC):
+                    parts = [t for t in (DirectDocxParser.__paragraph_text(p) for p in tc.iter(_P)) if t]
+                    row_data.append(' '.join(parts).strip())
+                if row_data:
                     table_data.append(row_data)
-
-            if table_data:  # 只添加非空表格
+            if table_data:
                 all_tables.append(table_data)
-
         return all_tables
 
-    def _extract_cell_text(self, cell_element) -> str:
-        """提取单元格内的文本内容"""
-        text_parts = []
-
-        # 提取段落文本
-        for p_elem in cell_element.findall('.//w:p', self.namespace):
-            para_text = []
-            for t_elem in p_elem.findall('.//w:t', self.namespace):
-                if t_elem.text:
-                    para_text.append(t_elem.text)
+    @staticmethod
+    def __parse_paragraphs(root) -> List[str]:
+        """全部非空段落（含表格内的段落）"""
+        return [p for p in (DirectDocxParser.__paragraph_text(p).strip() for p in root.iter(_P)) if p]
 
-            if para_text:
-                text_parts.append(''.join(para_text))
-
-        return ' '.join(text_parts)
+    @property
+    def sheets(self) -> List[List[List[str]]]:
+        return self.__sheets
 
     @property
     def paragraphs(self) -> List[str]:
-        """直接从XML解析段落文本"""
-        return self._parse_xml_paragraphs(self.__xml_content)
-
-    def _parse_xml_paragraphs(self, xml_content: bytes) -> List[str]:
-        """解析XML中的段落文本"""
-        root = ET.fromstring(xml_content)
-        paragraphs = []
-
-        for p_elem in root.findall('.//w:p', self.namespace):
-            para_text = []
-            for t_elem in p_elem.findall('.//w:t', self.namespace):
-                if t_elem.text:
-                    para_text.append(t_elem.text)
-
-            if para_text:
-                paragraph = ''.join(para_text).strip()
-                if paragraph:
-                    paragraphs.append(paragraph)
-
-        return paragraphs
+        return self.__paragraphs
 
 
 class Word(ParasSheets):
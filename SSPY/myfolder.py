@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """此文件用于解析遍历文件夹以及拷贝文件"""
-import copy
 import os
 import shutil
 from pathlib import Path
 import time
 
+from .helperfunction import FrozenList
+
 
 def get_filename_with_extension(file_path):
     """
@@ -162,6 +163,7 @@ class DefFolder:
         self.__paths = self.collect_file_paths(self.__root_dir, if_print = self.__if_print)
         if extensions is not None:
             self.__paths = self.get_paths_by(extensions)
+        self.__paths = FrozenList(self.__paths)
         if self.__if_print: print('Done!')
 
     @staticmethod
@@ -211,8 +213,9 @@ class DefFolder:
         return file_paths
 
     @property
-    def paths(self):
-        return copy.deepcopy(self.__paths)
+    def paths(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__paths
 
     @property
     def root_dir(self):
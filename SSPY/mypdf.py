@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
-import copy
 
-import pdfplumber
-from .helperfunction import clean_enter, clean_space
+from .helperfunction import clean_enter, FrozenList, freeze
 
 
 class PdfLoad:
@@ -12,19 +10,28 @@ class PdfLoad:
         self,
         pdf_path: str = None,
         table_only: bool = True,
-        if_print: bool = False):
+        if_print: bool = False,
+        anchors: list[str] = None,
+        neighbors: int = 0):
+        """
+        Args:
+            pdf_path:文件路径
+            table_only:是否只提取表格
+            if_print:是否打印提示
+            anchors:定向解析的锚点关键词（部分匹配），只在文字中含有关键词的页面上识别表格，
+                    提取到含有任一关键词表格的那一页为止，之后的页面不再提取表格与文字
+            neighbors:同时识别关键词页面前后各neighbors页的表格，用于跨页的表格
+        """
         self.__if_print = if_print
         if if_print:
             print(pdf_path)
         self.__path = pdf_path
         self.__tableOnly = table_only
-        self.__sheets = []
-        self.__pageList = []
-        if self.__tableOnly:
-            self.__extract_tables()
-        else:
-            self.__extract_tables()
-            self.__extract_text()
+        self.__anchors = anchors
+        self.__neighbors = neighbors
+        self.__sheets: FrozenList = FrozenList()
+        self.__pageList: FrozenList = FrozenList()
+        self.__extract()
 
     @property
     def path(self):
@@ -35,18 +42,20 @@ class PdfLoad:
         self.__path = path
 
     @property
-    def sheets(self):
-        return copy.deepcopy(self.__sheets)
+    def sheets(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__sheets
 
     @property
-    def pages(self):
-        return copy.deepcopy(self.__pageList)
+    def pages(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__pageList
 
     def get_pages(self, target_pagenum: list | int):
         if self.__tableOnly: return None
         if isinstance(target_pagenum, int):
             if len(self.__pageList) >= target_pagenum >= 1:
-                return copy.deepcopy(self.__pageList[target_pagenum - 1])
+                return self.__pageList[target_pagenum - 1]
         if isinstance(target_pagenum, list):
             outp = []
             for i in target_pagenum:
@@ -55,10 +64,10 @@ class PdfLoad:
                         outp.append(self.__pageList[i - 1])
                 else:
                     return None
-            return copy.deepcopy(outp)
+            return FrozenList(outp)
         return None
 
-    def get_sheet(self, index: int | str = None, part = False) -> list[list[str]] | None:
+    def get_sheet(self, index: int | str = None, part = False) -> FrozenList | None:
         """
         Args:
             index:按照关键词获取
@@ -70,37 +79,27 @@ class PdfLoad:
         if not self.__tableOnly: return None
         if isinstance(index, int):
             if len(self.__sheets) > index:
-                return copy.deepcopy(self.__sheets[index])
+                return self.__sheets[index]
         if isinstance(index, str):  # 按照关键值查找sheet
             for sheet in self.__sheets:
                 if if_in(index, sheet, target_as_sub = part, lib_as_sub = part):
-                    return copy.deepcopy(sheet)
+                    return sheet
         return None
 
-    def __extract_tables(self):
-        with pdfplumber.open(self.__path) as mypdf:
-            if len(mypdf.pages) <= 0: return False
-            tables = []
-            for page in mypdf.pages:
-                tables.extend(page.extract_tables())
-            self.__sheets = clean_enter(tables, '')
-        return True
-
-    def __extract_text(self):
-        import fitz  # PyMuPDF
-        try:
-            pdf = fitz.open(self.__path)
-            for page_num in range(len(pdf)):
-                p_text: list[str] = []
-                page = pdf.load_page(page_num)
-                # 关键步骤：以字典形式获取页面中的所有块信息
-                blocks_dict = page.get_text("dict")
-                for block in blocks_dict["blocks"]:
-                    if block["type"] == 0:
-                        # 遍历块中的每一行和每一个span
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                p_text.append(clean_space(span["text"], ''))
-                self.__pageList.append(p_text)
-        except Exception as e:
-            print(f'pdf文件"{self.__path}"解析失败：{e}，已跳过...')
+    def __extract(self):
+        """打开一次文件，同时提取表格与（table_only为False时）每页的文字"""
+        from .myff.document.pdf import PdfStream
+        stop = None
+        if self.__anchors:
+            from .fuzzy.search import searched_recursive as if_in
+            anchors = self.__anchors
+            stop = lambda tables: any(
+                if_in(a, clean_enter(tables, ''), target_as_sub = True, lib_as_sub = True) for a in anchors)
+        pdf = PdfStream(
+            self.__path,
+            text = not self.__tableOnly,
+            stop = stop,
+            keywords = self.__anchors,
+            neighbors = self.__neighbors)
+        self.__sheets = freeze(clean_enter(pdf.tables, ''))
+        self.__pageList = freeze(pdf.pages)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""多进程解析：子进程逐个文件执行任务，主进程按照提交顺序取回结果"""
+from typing import Callable, Iterable
+
+from .helperfunction import _exit
+
+
+def _run_captured(func: Callable, args: tuple) -> tuple[object, str, list[tuple]]:
+    """
+    子进程任务：执行func(*args)，收集其打印的内容与通过communitor发送的消息
+    子进程中没有注册交换器，消息不收集就只会变成子进程stderr上的警告
+    Returns:
+        (结果, 打印的内容, 发送的消息(msg, color, ptime))
+    """
+    import io
+    from contextlib import redirect_stdout
+    from .communitor import core
+    posted: list[tuple] = []
+
+    def collect(request):
+        if isinstance(request, tuple) and len(request) == 4 and request[0] == 'msg':
+            posted.append(request[1:])
+        return None
+
+    out = io.StringIO()
+    core.register_communitor(collect)
+    try:
+        with redirect_stdout(out):
+            result = func(*args)
+    finally:
+        core.register_communitor(None)
+    return result, out.getvalue(), posted
+
+
+def ordered_pool_map(
+    func: Callable,
+    args_list: Iterable[tuple],
+    max_workers: int,
+    stop_flag = None):
+    """
+    使用spawn启动的进程池执行func(*args)，按照args_list的顺序逐个产生 (序号, 结果)
+    子进程打印的内容与发送的消息在主进程中按顺序重新打印、发送
+    stop_flag被设置时取消尚未开始的任务并停止产生结果
+    Args:
+        func:模块级函数，参数与返回值都需要可以pickle
+        args_list:每个任务的参数
+        max_workers:进程数
+        stop_flag:threading.Event
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, wait
+    from .communitor.core import postText
+    # 图形界面进程中含有多个线程，统一使用spawn启动子进程
+    pool = ProcessPoolExecutor(max_workers = max_workers, mp_context = multiprocessing.get_context('spawn'))
+    try:
+        futures = [pool.submit(_run_captured, func, tuple(args)) for args in args_list]
+        for i, f in enumerate(futures):
+            while not f.done():
+                if _exit(stop_flag): return
+                wait((f,), timeout = 0.2)
+            result, printed, posted = f.result()
+            if _exit(stop_flag): return
+            if printed: print(printed, end = '')
+            for msg, color, ptime in posted:
+                postText(msg, color, ptime)
+            yield i, result
+    finally:
+        pool.shutdown(wait = not _exit(stop_flag), cancel_futures = True)
@@ -6,9 +6,10 @@ If you use this script alone, we recommend that you hijack the ppocr downloader
 """
 import copy
 from openpyxl import load_workbook, Workbook
-from openpyxl.styles import Font, Border, Alignment
+from openpyxl.styles import Font, Border, Alignment, NamedStyle
 from .globalconstants import GlobalConstants as gc
 from .PersonneInformation import DefPerson
+from .helperfunction import FrozenList, freeze, _exit
 
 
 def trans_list_to_person(
@@ -18,7 +19,7 @@ def trans_list_to_person(
     inkey_as_sub: bool = False,
     stdkey_as_sub: bool = True) -> DefPerson | None:
     per = DefPerson()
-    info = copy.deepcopy(in_info)
+    info = in_info
     if classname is not None:
         per.classname = classname
     for i in range(len(header)):
@@ -82,6 +83,319 @@ def clear_empty_lines(in_sheet: list[list]) -> list:
     return new_sheet
 
 
+_NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_NS_PKG_REL = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_TAG_ROW = f'{{{_NS_MAIN}}}row'
+_TAG_C = f'{{{_NS_MAIN}}}c'
+_TAG_V = f'{{{_NS_MAIN}}}v'
+_TAG_IS = f'{{{_NS_MAIN}}}is'
+_TAG_T = f'{{{_NS_MAIN}}}t'
+_TAG_R = f'{{{_NS_MAIN}}}r'
+_TAG_SI = f'{{{_NS_MAIN}}}si'
+_TAG_DIM = f'{{{_NS_MAIN}}}dimension'
+
+
+def _iterparse(source, tags: tuple[str, ...]):
+    """只产生指定标签的元素（end事件）"""
+    from xml.etree.ElementTree import iterparse
+    return (el for _, el in iterparse(source) if el.tag in tags)
+
+
+class XlsxNativeUnsupported(Exception):
+    """原生读取器无法处理的文件，需要回退到openpyxl"""
+
+
+def _rich_text(element) -> str:
+    """<si>或<is>中的纯文本：直接的<t>加上各个<r>中的<t>，忽略注音<rPh>"""
+    out = []
+    for child in element:
+        if child.tag == _TAG_T:
+            out.append(child.text or '')
+        elif child.tag == _TAG_R:
+            t = child.find(_TAG_T)
+            if t is not None and t.text is not None:
+                out.append(t.text)
+    return ''.join(out)
+
+
+def _column_index(coordinate: str) -> int:
+    """由单元格坐标得到列号（从1开始）"""
+    col = 0
+    for ch in coordinate:
+        o = ord(ch) - 64
+        if not 0 < o < 27: break
+        col = col * 26 + o
+    return col
+
+
+class XlsxStreamReader:
+    """
+    不经过openpyxl的xlsx流式读取器：直接从zip中iterparse共享字符串表与sheet的xml
+    只产生单元格的值，结果与load_workbook(read_only = True, data_only = True)的iter_rows(values_only = True)相同
+    无法处理的文件（非zip、Strict OOXML等）在构造时抛出异常，由调用方回退到openpyxl
+    """
+
+    def __init__(self, path: str):
+        import zipfile
+        self.__zip = zipfile.ZipFile(path)
+        try:
+            self.__parse_workbook()
+        except Exception:
+            self.__zip.close()
+            raise
+        self.__shared: list[str] | None = None
+        self.__date_styles: tuple[set[int], set[int]] | None = None
+
+    def __xml(self, name: str):
+        from xml.etree import ElementTree
+        with self.__zip.open(name) as f:
+            return ElementTree.parse(f).getroot()
+
+    def __rels(self, name: str) -> dict[str, tuple[str, str]]:
+        """关系文件：Id -> (类型, 目标在zip中的路径)"""
+        import posixpath
+        base = posixpath.dirname(posixpath.dirname(name))
+        out = {}
+        for rel in self.__xml(name).iter(f'{{{_NS_PKG_REL}}}Relationship'):
+            target = rel.get('Target', '')
+            if target.startswith('/'):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(base, target))
+            out[rel.get('Id')] = (rel.get('Type', ''), target)
+        return out
+
+    def __parse_workbook(self):
+        """读取sheet列表、共享字符串表与样式表的位置以及日期系统"""
+        import posixpath
+        from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900, CALENDAR_MAC_1904
+        wb_path = None
+        for t, target in self.__rels('_rels/.rels').values():
+            if t.endswith('/officeDocument'):
+                wb_path = target
+        if wb_path is None: raise XlsxNativeUnsupported('未找到workbook')
+        root = self.__xml(wb_path)
+        if root.tag != f'{{{_NS_MAIN}}}workbook': raise XlsxNativeUnsupported(root.tag)
+        rels = self.__rels(posixpath.join(posixpath.dirname(wb_path), '_rels', posixpath.basename(wb_path) + '.rels'))
+        pr = root.find(f'{{{_NS_MAIN}}}workbookPr')
+        date1904 = pr is not None and pr.get('date1904', 'false').lower() in ('1', 'true')
+        self.__epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+        self.__sheets: list[tuple[str, str]] = []
+        """(名称, 路径)，只包含工作表"""
+        for sh in root.iter(f'{{{_NS_MAIN}}}sheet'):
+            t, target = rels.get(sh.get(f'{{{_NS_REL}}}id'), ('', ''))
+            if t.endswith('/worksheet'):
+                self.__sheets.append((sh.get('name'), target))
+        self.__shared_path = None
+        self.__styles_path = None
+        for t, target in rels.values():
+            if t.endswith('/sharedStrings'):
+                self.__shared_path = target
+            elif t.endswith('/styles'):
+                self.__styles_path = target
+
+    def close(self):
+        self.__zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [n for n, _ in self.__sheets]
+
+    def __shared_strings(self) -> list[str]:
+        """共享字符串表，第一次使用时流式读取"""
+        if self.__shared is None:
+            shared = []
+            if self.__shared_path is not None and self.__shared_path in self.__zip.namelist():
+                with self.__zip.open(self.__shared_path) as f:
+                    for el in _iterparse(f, (_TAG_SI,)):
+                        shared.append(_rich_text(el).replace('x005F_', ''))
+                        el.clear()
+            self.__shared = shared
+        return self.__shared
+
+    def __dates(self) -> tuple[set[int], set[int]]:
+        """日期格式与时长格式对应的样式序号"""
+        if self.__date_styles is None:
+            from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+            dates, tds = set(), set()
+            if self.__styles_path is not None and self.__styles_path in self.__zip.namelist():
+                root = self.__xml(self.__styles_path)
+                custom = {int(n.get('numFmtId')): n.get('formatCode')
+                          for n in root.iter(f'{{{_NS_MAIN}}}numFmt')}
+                xfs = root.find(f'{{{_NS_MAIN}}}cellXfs')
+                for idx, xf in enumerate(() if xfs is None else xfs.iter(f'{{{_NS_MAIN}}}xf')):
+                    i = int(xf.get('numFmtId', 0))
+                    fmt = custom[i] if i in custom else builtin_format_code(i)
+                    if is_date_format(fmt): dates.add(idx)
+                    if is_timedelta_format(fmt): tds.add(idx)
+            self.__date_styles = (dates, tds)
+        return self.__date_styles
+
+    def __sheet_path(self, sheet: int | str) -> str | None:
+        if isinstance(sheet, str):
+            for n, p in self.__sheets:
+                if n == sheet: return p
+            return None
+        return self.__sheets[sheet][1] if sheet < len(self.__sheets) else None
+
+    def has_sheet(self, sheet: int | str) -> bool:
+        return self.__sheet_path(sheet) is not None
+
+    def rows(self, sheet: int | str = 0, columns: list[int] = None):
+        """
+        逐行产生某个sheet的值
+        Args:
+            sheet:sheet的序号或名称
+            columns:只取出这些列（从0开始），每行恰好为len(columns)个值；None为整行
+        """
+        from warnings import warn
+        from openpyxl.utils.cell import range_boundaries
+        from openpyxl.utils.datetime import from_excel, from_ISO8601
+
+        path = self.__sheet_path(sheet)
+        if path is None: return
+        shared = self.__shared_strings()
+        dates, tds = self.__dates()
+        epoch = self.__epoch
+        wanted = None if columns is None else {c + 1 for c in columns}
+        """需要取值的列号（从1开始）"""
+
+        def build(values: dict[int, object], width: int) -> tuple:
+            if columns is not None:
+                return tuple(values.get(c + 1, None) if c < width else None for c in columns)
+            return tuple(values.get(c, None) for c in range(1, width + 1))
+
+        max_col = max_row = None
+        empty_row = None
+        """缺失的行"""
+        counter = 1
+        """下一个应当产生的行号"""
+        idx = 1
+        row_counter = 0
+        with self.__zip.open(path) as f:
+            for el in _iterparse(f, (_TAG_DIM, _TAG_ROW)):
+                if el.tag == _TAG_DIM and empty_row is None:
+                    ref = el.get('ref')
+                    if ref:
+                        _, _, max_col, max_row = range_boundaries(ref)
+                    continue
+                if el.tag != _TAG_ROW: continue
+                if empty_row is None:
+                    empty_row = build({}, 0 if max_col is None else max_col)
+
+                r = el.get('r')
+                row_counter = int(float(r)) if r is not None else row_counter + 1
+                idx = row_counter
+                if max_row is not None and idx > max_row: break
+
+                values: dict[int, object] = {}
+                col = 0
+                for c in el:
+                    coord = c.get('r')
+                    col = _column_index(coord) if coord else col + 1
+                    if wanted is not None and col not in wanted: continue
+                    t = c.get('t', 'n')
+                    if t == 'inlineStr':
+                        node = c.find(_TAG_IS)
+                        value = _rich_text(node) if node is not None else None
+                    else:
+                        value = c.findtext(_TAG_V, None) or None
+                        if value is not None:
+                            if t == 'n':
+                                value = float(value) if ('.' in value or 'E' in value or 'e' in value) else int(value)
+                                s = c.get('s')
+                                s = int(s) if s else 0
+                                if s in dates:
+                                    try:
+                                        value = from_excel(value, epoch, timedelta = s in tds)
+                                    except (OverflowError, ValueError):
+                                        warn(f'Cell {coord} is marked as a date but the serial value {value} '
+                                             f'is outside the limits for dates. The cell will be treated as an error.')
+                                        value = '#VALUE!'
+                            elif t == 's':
+                                value = shared[int(value)]
+                            elif t == 'b':
+                                value = bool(int(value))
+                            elif t == 'd':
+                                value = from_ISO8601(value)
+                    values[col] = value
+                el.clear()
+
+                while counter < idx:
+                    counter += 1
+                    yield empty_row
+                if counter <= idx:
+                    counter += 1
+                    # 与openpyxl相同：没有维度信息时行宽取最后一个单元格的列号
+                    yield build(values, col if max_col is None else max_col)
+        if max_row is not None and max_row < idx:
+            while counter <= max_row:
+                counter += 1
+                yield empty_row
+
+
+_NATIVE_ERRORS = (XlsxNativeUnsupported, KeyError, ValueError, IndexError, SyntaxError)
+"""原生读取器遇到这些异常时回退到openpyxl（ElementTree.ParseError是SyntaxError的子类）"""
+
+
+def _openpyxl_rows(path: str, sheet: int | str = 0, columns: list[int] = None):
+    """openpyxl只读模式逐行产生值"""
+    wb = load_workbook(path, data_only = True, read_only = True)
+    try:
+        if isinstance(sheet, str):
+            if sheet not in wb.sheetnames: return
+            ws = wb[sheet]
+        else:
+            if sheet >= len(wb.worksheets): return
+            ws = wb.worksheets[sheet]
+        for row in ws.iter_rows(values_only = True):
+            if columns is None:
+                yield row
+            else:
+                yield tuple(row[c] if c < len(row) else None for c in columns)
+    finally:
+        wb.close()
+
+
+def _stream_rows(reader: XlsxStreamReader, path: str, sheet: int | str, columns: list[int] | None):
+    """使用已打开的原生读取器逐行产生值，中途出错时由openpyxl从出错的行继续"""
+    n = 0
+    try:
+        with reader:
+            for row in reader.rows(sheet, columns):
+                yield row
+                n += 1
+        return
+    except _NATIVE_ERRORS:
+        pass
+    for i, row in enumerate(_openpyxl_rows(path, sheet, columns)):
+        if i >= n: yield row
+
+
+def iter_xlsx_rows(path: str, sheet: int | str = 0, columns: list[int] = None):
+    """
+    流式读取xlsx中某个sheet的值，优先使用XlsxStreamReader，无法处理时回退到openpyxl
+    Args:
+        path:路径
+        sheet:sheet的序号或名称
+        columns:只取出这些列（从0开始），None为整行
+    """
+    import zipfile
+    try:
+        reader = XlsxStreamReader(path)
+    except (zipfile.BadZipFile, *_NATIVE_ERRORS):
+        yield from _openpyxl_rows(path, sheet, columns)
+        return
+    yield from _stream_rows(reader, path, sheet, columns)
+
+
 class XlsxLoad:
     """读取xlsx文件的类"""
 
@@ -91,10 +405,15 @@ class XlsxLoad:
         const_classname: bool = True,
         classname: str = None,
         ifp: bool = False,
-        header: list[str] = None) -> None:
+        header: list[str] = None,
+        lazy: bool = False) -> None:
+        """
+        Args:
+            lazy:为True时不预先读取全部sheet，通过iter_rows/iter_persons按需流式读取
+        """
         from .myfolder import split_filename_and_extension
         self.__path = _path
-        self.__sheets = []
+        self.__sheets: FrozenList = FrozenList()
         self.__ifp = ifp
         self.__const_classname = const_classname
         if const_classname:
@@ -103,7 +422,9 @@ class XlsxLoad:
             else:
                 self.__classname = classname
         self.__header = header
-        self.__load()
+        self.__lazy = lazy
+        if not lazy:
+            self.__load()
 
     def __load(self):
         """读取文件"""
@@ -115,31 +436,139 @@ class XlsxLoad:
             print(f'xlsx文件"{self.__path}"解析出错：{e} ，已跳过...')
             return
 
+        sheets = []
         for ws in wb.worksheets:
-            sh = []
-            for row in ws.iter_rows(values_only = True):  # 遍历全部
-                sh.append(row)
-            self.__sheets.append(sh)
+            # 行本身就是不可变的tuple，只需包装一层
+            sh = FrozenList(FrozenList(row) for row in ws.iter_rows(values_only = True))  # 遍历全部
+            sheets.append(sh)
+        self.__sheets = FrozenList(sheets)
         wb.close()
         if self.__ifp:
             print(' - Done!')
 
+    def __open_rows(self, sheet: int | str):
+        """打开某个sheet的行生成器，无法读取时返回None"""
+        if not self.__lazy:
+            if isinstance(sheet, int) and sheet < len(self.__sheets):
+                return (row for row in self.__sheets[sheet])
+            return None
+        try:
+            reader = XlsxStreamReader(self.__path)
+        except Exception:
+            reader = None  # 交给openpyxl处理，出错时由它给出提示
+        if reader is not None:
+            if not reader.has_sheet(sheet):
+                reader.close()
+                return None
+            return _stream_rows(reader, self.__path, sheet, None)
+        try:
+            wb = load_workbook(self.__path, data_only = True, read_only = True)
+        except Exception as e:
+            print(f'xlsx文件"{self.__path}"解析出错：{e} ，已跳过...')
+            return None
+        if isinstance(sheet, str):
+            ws = wb[sheet] if sheet in wb.sheetnames else None
+        else:
+            ws = wb.worksheets[sheet] if sheet < len(wb.worksheets) else None
+        if ws is None:
+            wb.close()
+            return None
+
+        def rows():
+            try:
+                yield from ws.iter_rows(values_only = True)
+            finally:
+                wb.close()
+
+        return rows()
+
+    def iter_rows(self, sheet: int | str = 0):
+        """
+        逐行产生某个sheet的内容，使用XlsxStreamReader（无法处理时使用openpyxl的只读游标），不在内存中保留整张表
+        已经预先读取时直接遍历已读取的内容
+        Args:
+            sheet:sheet的序号或名称
+        """
+        rows = self.__open_rows(sheet)
+        if rows is None: return
+        yield from rows
+
+    def iter_persons(
+        self,
+        inkey_as_sub: bool = False,
+        stdkey_as_sub: bool = False,
+        stop_flag = None,
+        sheet: int | str = 0):
+        """
+        逐个产生人员，表头在读取过程中识别，结果与get_personList相同
+        表头之前的行会暂存，找到表头后再一并解析
+        Args:
+            stop_flag:threading.Event，被设置时停止读取
+            sheet:sheet的序号或名称
+        """
+        header = None
+        pending: list = []
+        """表头出现之前的行"""
+        classname = self.__classname if self.__const_classname else None
+        rows = self.__open_rows(sheet)
+        if rows is None: return
+        for row in rows:
+            if _exit(stop_flag):
+                rows.close()
+                return
+            if header is None:
+                for cell in row:
+                    if DefPerson.get_stdkey(cell, stdkey_as_sub = stdkey_as_sub) is not None:
+                        header = tuple(row)
+                        break
+                if header is None:
+                    pending.append(row)
+                    continue
+                ready, pending = pending, []
+            else:
+                ready = (row,)
+            for r in ready:
+                p = trans_list_to_person(
+                    header, r,
+                    classname = classname,
+                    inkey_as_sub = inkey_as_sub,
+                    stdkey_as_sub = stdkey_as_sub)
+                if p is not None:
+                    yield p
+
+        if header is not None: return
+        if self.__header is None:
+            print('文件 \"' + self.__path + '\" 未找到表头')
+            return
+        for r in pending:
+            if _exit(stop_flag): return
+            p = trans_list_to_person(
+                self.__header, r,
+                classname = classname,
+                inkey_as_sub = inkey_as_sub,
+                stdkey_as_sub = stdkey_as_sub)
+            if p is not None:
+                yield p
+
     @property
     def path(self):
         """返回文件路径"""
         return self.__path
 
     @property
-    def sheets(self):
-        """返回解析到的sheet"""
-        return copy.deepcopy(self.__sheets)
+    def sheets(self) -> FrozenList:
+        """返回解析到的sheet（只读快照，需要修改时调用copy()）"""
+        return self.__sheets
 
     def get_personList(
         self,
         inkey_as_sub: bool = False,
         stdkey_as_sub: bool = False):
         pers: list[DefPerson] = []
-        header, only_sheet = get_header_from_xlsx(self.sheets[0], stdkey_as_sub = stdkey_as_sub)
+        if self.__lazy:
+            return list(self.iter_persons(inkey_as_sub = inkey_as_sub, stdkey_as_sub = stdkey_as_sub))
+        if len(self.__sheets) == 0: return pers
+        header, only_sheet = get_header_from_xlsx(self.__sheets[0], stdkey_as_sub = stdkey_as_sub)
         if self.__header is None and header is None:
             print('文件 \"' + self.__path + '\" 未找到表头')
             return pers
@@ -165,6 +594,57 @@ class XlsxLoad:
         return pers
 
 
+def _load_person_records(
+    path: str,
+    classname: str | None,
+    inkey_as_sub: bool,
+    stdkey_as_sub: bool) -> list[tuple]:
+    """子进程任务：流式解析一个xlsx文件，返回紧凑的人员记录"""
+    x = XlsxLoad(path, classname = classname, lazy = True)
+    return [p.to_record() for p in x.iter_persons(inkey_as_sub = inkey_as_sub, stdkey_as_sub = stdkey_as_sub)]
+
+
+def load_persons_parallel(
+    paths: list[str] | tuple[str, ...],
+    classnames: list[str | None] | tuple[str | None, ...] = None,
+    max_workers: int = None,
+    stop_flag = None,
+    inkey_as_sub: bool = False,
+    stdkey_as_sub: bool = False):
+    """
+    多进程解析多个xlsx文件，每个子进程解析一个文件并返回紧凑的人员记录
+    按照paths的顺序逐个产生 (序号, 路径, 人员list)，调用方可以据此发布进度
+    stop_flag被设置时取消尚未开始的任务并停止产生结果
+    Args:
+        paths:xlsx文件路径
+        classnames:每个文件对应的班级名，None表示使用文件名
+        max_workers:进程数，默认为CPU核心数；不超过1或只有一个文件时在当前进程中解析
+        stop_flag:threading.Event
+    """
+    import os
+    paths = list(paths)
+    if classnames is None: classnames = [None] * len(paths)
+    if max_workers is None: max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(paths))
+
+    if max_workers <= 1:
+        for i, (p, cn) in enumerate(zip(paths, classnames)):
+            if _exit(stop_flag): return
+            x = XlsxLoad(p, classname = cn, lazy = True)
+            pers = list(x.iter_persons(inkey_as_sub = inkey_as_sub, stdkey_as_sub = stdkey_as_sub, stop_flag = stop_flag))
+            if _exit(stop_flag): return
+            yield i, p, pers
+        return
+
+    from .myprocess import ordered_pool_map
+    for i, records in ordered_pool_map(
+        _load_person_records,
+        [(p, cn, inkey_as_sub, stdkey_as_sub) for p, cn in zip(paths, classnames)],
+        max_workers,
+        stop_flag):
+        yield i, paths[i], [DefPerson.from_record(r) for r in records]
+
+
 class XlsxWrite:
     """xlsx写文件"""
 
@@ -184,6 +664,7 @@ class XlsxWrite:
         has_title: bool = False,
         has_header: bool = False,
         alignment: Alignment = gc.alignmentStd,
+        write_only: bool = True,
     ):
         """
         Parameters
@@ -214,10 +695,12 @@ class XlsxWrite:
             是否有表头
         alignment: Alignment
             对齐方式
+        write_only: bool
+            使用openpyxl的只写模式与预注册的NamedStyle快速写入，输出与逐格设置样式相同
         """
         if widths is None: widths = []
         self.__path = path
-        self.__sheet = copy.deepcopy(sheet)
+        self.__sheet = freeze(sheet)
         self.__title = title
         self.__fontRegular = font_regular
         self.__fontTitle = font_title
@@ -231,44 +714,67 @@ class XlsxWrite:
         self.__widths = copy.deepcopy(widths)
         self.__height = height
         self.__heightTitle = height_title
+        self.__writeOnly = write_only
 
     @property
     def can_write(self) -> bool:
         """检查能否开始写入表格"""
         if self.__path is None or self.__path == '': return False
-        if self.__sheet is None or self.__sheet == []: return False
+        if self.__sheet is None or len(self.__sheet) == 0: return False
         if self.__title == '' and self.__hasTitle: return False
         return True
 
     def write(self, ifp: bool = False) -> bool:
         """写入文件"""
-        width_default = 8.43
         if not self.can_write: return False
         if ifp: print('write xlsx file as \"' + self.__path + '\"', end = '')
-        # 创建wb
-        wb = Workbook()
-        ws = wb.active
-        if self.__hasTitle: ws.title = self.__title
+        if self.fast_writable:
+            wb = Workbook(write_only = True)
+            self._fill_fast(wb, self.__title if self.__hasTitle else None, {})
+        else:
+            wb = Workbook()
+            ws = wb.active
+            if self.__hasTitle: ws.title = self.__title
+            self._fill_regular(ws)
+        wb.save(self.__path)
+        wb.close()
+        if ifp: print(' - Done!')
+        return True
+
+    @property
+    def fast_writable(self) -> bool:
+        """能否使用只写模式；含空行的表格在逐格模式下存在特殊的样式范围，交给逐格模式处理"""
+        return self.__writeOnly and all(len(row) > 0 for row in self.__sheet)
+
+    def __column_widths(self, max_column: int) -> list[float]:
+        """每一列的列宽，未设置列宽时为空"""
+        width_default = 8.43
+        out: list[float] = []
+        if self.__widths is None or len(self.__widths) == 0: return out
+        for i in range(1, max_column + 1):
+            if i < len(self.__widths) and self.__widths[i - 1] > 0:
+                width_default = self.__widths[i - 1]
+                out.append(width_default)
+            elif i == len(self.__widths):
+                if self.__widths[i - 1] <= 0:
+                    out.append(width_default)
+                else:
+                    width_default = self.__widths[i - 1]
+                    out.append(width_default)
+            else:
+                out.append(width_default)
+        return out
+
+    def _fill_regular(self, ws):
+        """逐格设置样式，写入普通模式工作簿中的一个sheet"""
         for row in self.__sheet:
             ws.append(row)
         if self.__height is not None:
             for i in range(1, ws.max_row + 2):  # 这里我不晓得为什么是2
                 ws.row_dimensions[i].height = self.__height
 
-        if self.__widths is not None and len(self.__widths) > 0:
-            for i in range(1, ws.max_column + 1):
-                col_letter = ws.cell(row = 1, column = i).column_letter
-                if i < len(self.__widths) and self.__widths[i - 1] > 0:
-                    ws.column_dimensions[col_letter].width = self.__widths[i - 1]
-                    width_default = self.__widths[i - 1]
-                elif i == len(self.__widths):
-                    if self.__widths[i - 1] <= 0:
-                        ws.column_dimensions[col_letter].width = width_default
-                    else:
-                        ws.column_dimensions[col_letter].width = self.__widths[i - 1]
-                        width_default = self.__widths[i - 1]
-                else:
-                    ws.column_dimensions[col_letter].width = width_default
+        for i, w in enumerate(self.__column_widths(ws.max_column), 1):
+            ws.column_dimensions[ws.cell(row = 1, column = i).column_letter].width = w
 
         for row in ws.iter_rows(values_only = False):
             for cell in row:
@@ -285,10 +791,71 @@ class XlsxWrite:
             ws.cell(row = 1, column = 1).font = self.__fontTitle
             ws.cell(row = 1, column = 1).alignment = self.__alignment
             ws.row_dimensions[1].height = self.__heightTitle if self.__heightTitle > 0 else 25
-        wb.save(self.__path)
-        wb.close()
-        if ifp: print(' - Done!')
-        return True
+
+    def _fill_fast(self, wb: Workbook, sheet_title: str | None, styles: dict[tuple, str]):
+        """
+        在只写模式的工作簿中新建一个sheet并写入：先写标题行，行高列宽写入维度信息，单元格引用预注册的NamedStyle
+        Args:
+            wb:只写模式的工作簿
+            sheet_title:sheet的名称，None为默认名称
+            styles:(字体, 对齐, 边框) -> 已注册的NamedStyle名称，同一工作簿的多个sheet共享
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        ws = wb.create_sheet(title = sheet_title)
+        max_column = max(len(row) for row in self.__sheet)
+        border = self.__border if self.__hasBorder else Border()
+
+        def named(font: Font, b: Border | None) -> str:
+            key = (font, self.__alignment, b)
+            name = styles.get(key, None)
+            if name is None:
+                name = f'sspy{len(styles)}'
+                wb.add_named_style(NamedStyle(
+                    name = name, font = font, alignment = self.__alignment, border = Border() if b is None else b))
+                styles[key] = name
+            return name
+
+        style_regular = named(self.__fontRegular, border)
+        style_header = named(self.__fontHeader, border) if self.__hasHeader else style_regular
+        style_title = named(self.__fontTitle, None) if self.__hasTitle else None
+
+        # 只写模式下行高、列宽必须在写入对应的行之前设置
+        for i, w in enumerate(self.__column_widths(max_column), 1):
+            ws.column_dimensions[get_column_letter(i)].width = w
+
+        pool: dict[str, list[WriteOnlyCell]] = {}
+        """每种样式一行预先设置好样式的单元格；只写模式在append时立即写出，可以逐行复用"""
+
+        def cells(values, style: str) -> list[WriteOnlyCell]:
+            row = pool.get(style, None)
+            if row is None:
+                row = [WriteOnlyCell(ws) for _ in range(max_column)]
+                for c in row:
+                    c.style = style
+                pool[style] = row
+            for c, v in zip(row, values):
+                c.value = v
+            for c in row[len(values):]:
+                c.value = None
+            return row
+
+        r = 1
+        if self.__hasTitle:
+            ws.row_dimensions[r].height = self.__heightTitle if self.__heightTitle > 0 else 25
+            ws.merged_cells.add(f'A1:{get_column_letter(max_column)}1')
+            ws.append(cells([self.__title], style_title)[:1])
+            r += 1
+        for n, row in enumerate(self.__sheet):
+            if self.__height is not None:
+                ws.row_dimensions[r].height = self.__height
+            ws.append(cells(row, style_header if n == 0 else style_regular))
+            r += 1
+        # 逐格模式下无标题时，最后一行之后还有一个只设置了行高的空行
+        if self.__height is not None and not self.__hasTitle:
+            ws.row_dimensions[r].height = self.__height
+            ws.append([])
 
     @property
     def path(self):
@@ -302,13 +869,14 @@ class XlsxWrite:
             raise TypeError("路径必须是str类型")
 
     @property
-    def sheet(self):
-        return copy.deepcopy(self.__sheet)
+    def sheet(self) -> FrozenList:
+        """只读快照，需要修改时调用copy()"""
+        return self.__sheet
 
     @sheet.setter
     def sheet(self, value: list):
         if isinstance(value, list):
-            self.__sheet = copy.deepcopy(value)
+            self.__sheet = freeze(value)
         else:
             raise TypeError("sheet必须是list类型")
 
@@ -425,3 +993,98 @@ class XlsxWrite:
     def fontHeader(self, fontHeader: Font):
         self.__fontHeader = copy.deepcopy(fontHeader)
         self.__hasHeader = True
+
+
+_SPLIT_PARALLEL_MIN_CELLS = 200_000
+"""拆分输出时单元格总数超过此值才使用多进程，较小的表格进程启动的开销更大"""
+
+
+def _write_xlsx(writer: XlsxWrite) -> bool:
+    """子进程任务：写出一个xlsx文件"""
+    return writer.write()
+
+
+class XlsxBook:
+    """
+    批量输出：将多个XlsxWrite作为不同的sheet写入同一个工作簿，共享样式，只保存一次
+    也可以拆分为各自的文件（写到各XlsxWrite的path），文件较多较大时并发写出
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path:合并输出的工作簿路径
+        """
+        self.__path = path
+        self.__entries: list[tuple[str, XlsxWrite]] = []
+        """(sheet名称, 写入器)"""
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def names(self) -> list[str]:
+        """各sheet的名称"""
+        return [n for n, _ in self.__entries]
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def add(self, name: str, writer: XlsxWrite) -> bool:
+        """
+        添加一个sheet，名称会去除非法字符、截断到31个字符并去重
+        Returns:
+            是否添加（不能写入的表格会被忽略）
+        """
+        if not writer.can_write: return False
+        title = ''.join('_' if ch in '\\/?*[]:' else ch for ch in str(name))[:31] or 'Sheet'
+        used = set(self.names)
+        base, k = title, 1
+        while title in used:
+            k += 1
+            title = f'{base[:31 - len(str(k)) - 1]}_{k}'
+        self.__entries.append((title, writer))
+        return True
+
+    def write(self, ifp: bool = False) -> bool:
+        """将所有sheet写入path指向的工作簿"""
+        if self.__path is None or self.__path == '' or len(self.__entries) == 0: return False
+        if ifp: print('write xlsx file as \"' + self.__path + '\"', end = '')
+        if all(w.fast_writable for _, w in self.__entries):
+            wb = Workbook(write_only = True)
+            styles: dict[tuple, str] = {}
+            for name, w in self.__entries:
+                w._fill_fast(wb, name, styles)
+        else:
+            wb = Workbook()
+            wb.remove(wb.active)
+            for name, w in self.__entries:
+                w._fill_regular(wb.create_sheet(title = name))
+        wb.save(self.__path)
+        wb.close()
+        if ifp: print(' - Done!')
+        return True
+
+    def split(self, max_workers: int = None) -> list[str]:
+        """
+        拆分输出：每个sheet写到其XlsxWrite的path
+        Args:
+            max_workers:进程数，默认为CPU核心数；表格较小时在当前进程中依次写出
+        Returns:
+            写出的文件路径，按照添加的顺序
+        """
+        import os
+        writers = [w for _, w in self.__entries]
+        if max_workers is None: max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(writers))
+        cells = sum(len(row) for w in writers for row in w.sheet)
+        if max_workers <= 1 or cells < _SPLIT_PARALLEL_MIN_CELLS:
+            done = [w.write() for w in writers]
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(
+                max_workers = max_workers, mp_context = multiprocessing.get_context('spawn')) as pool:
+                done = list(pool.map(_write_xlsx, writers))
+        return [w.path for w, ok in zip(writers, done) if ok]
@@ -47,7 +47,7 @@ def renormalization(in_sheet: list[list[str]], path: str, cmtt):
     if in_sheet is None or len(in_sheet) == 0: return None
     per = trans_sheet_to_person(in_sheet, inkey_as_sub = True)
     """从表格获取人员信息"""
-    per.filepath = path
+    per.filepath = {path: path}
     if '推荐' in path:
         per.set_information('报名方式', '组织推荐')
     elif '自' in path:
@@ -61,3 +61,67 @@ def renormalization(in_sheet: list[list[str]], path: str, cmtt):
         per.set_information('报名方式', '组织推荐')
     per.ifsign = cmtt
     return per
+
+
+FORM_ANCHORS = ['所任职务', '应聘岗位']
+"""报名表（学员/班委）的锚点关键词，解析文件时找到含有它们的表格即停止"""
+
+
+def parse_form(path: str) -> DefPerson | None:
+    """
+    解析一份报名表文件（docx或pdf），学员报名表per.ifsign为False，班委报名表为True
+    docx优先取学员报名表，pdf优先取班委报名表
+    Args:
+        path:文件路径
+    Returns:
+        人员，无法解析时为None
+    """
+    import os
+    if os.path.splitext(path)[1].lower() == '.pdf':
+        from .mypdf import PdfLoad
+        pdf = PdfLoad(path, anchors = FORM_ANCHORS)
+        sheet, cmtt = pdf.get_sheet('应聘岗位', True), True
+        if sheet is None: sheet, cmtt = pdf.get_sheet('所任职务', True), False
+    else:
+        from .mydocx import DocxLoad
+        word = DocxLoad(path, anchors = FORM_ANCHORS)
+        sheet, cmtt = word.get_sheet_without_enter('所任职务'), False
+        if sheet is None: sheet, cmtt = word.get_sheet_without_enter('应聘岗位'), True
+    if sheet is None: return None
+    return renormalization(sheet, path, cmtt)
+
+
+def _parse_form_record(path: str) -> tuple | None:
+    """子进程任务：解析一份报名表，返回紧凑的人员记录，无法解析时为None"""
+    per = parse_form(path)
+    return per.to_record() if per is not None else None
+
+
+def parse_forms_parallel(
+    paths: list[str] | tuple[str, ...],
+    max_workers: int = None,
+    stop_flag = None):
+    """
+    多进程解析多份报名表，每个子进程解析一个文件并返回紧凑的人员记录
+    按照paths的顺序逐个产生 (序号, 路径, 人员或None)，None表示无法解析的文件，调用方可以据此发布进度
+    stop_flag被设置时取消尚未开始的任务并停止产生结果
+    Args:
+        paths:docx或pdf文件路径，可以混合
+        max_workers:进程数，默认为CPU核心数；不超过1或只有一个文件时在当前进程中解析
+        stop_flag:threading.Event
+    """
+    import os
+    from .helperfunction import _exit
+    paths = list(paths)
+    if max_workers is None: max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(paths))
+
+    if max_workers <= 1:
+        for i, p in enumerate(paths):
+            if _exit(stop_flag): return
+            yield i, p, parse_form(p)
+        return
+
+    from .myprocess import ordered_pool_map
+    for i, record in ordered_pool_map(_parse_form_record, [(p,) for p in paths], max_workers, stop_flag):
+        yield i, paths[i], (DefPerson.from_record(record) if record is not None else None)
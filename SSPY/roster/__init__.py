@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""总名单（花名册）的索引与储存模块"""
+from .index import RosterIndex, canonical_studentID, is_fuzzy_studentID, group_by_studentID
+from .table import RosterTable
+from .report import RosterReport
+from .store import PersonStore
+from .manifest import RunManifest, file_fingerprint
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""总名单的哈希索引"""
+from SSPY.PersonneInformation import DefPerson
+from SSPY.fuzzy.bktree import BKTree
+from SSPY.fuzzy.search import match_by, LEVEL
+
+
+def canonical_studentID(sid: str) -> str | None:
+    """
+    学号的规范形式，两个学号规范形式相同当且仅当DoQingziClass.is_same_studentID为真
+    规则：
+        1.长度小于4的学号不与任何学号相同，返回None
+        2.以't'或'T'结尾的学号统一为大写'T'结尾
+    Args:
+        sid:原始学号
+    Returns:
+        规范学号，不可比较时返回None
+    """
+    if not isinstance(sid, str) or len(sid) < 4: return None
+    if sid.endswith(('t', 'T')):
+        return sid[:-1] + 'T'
+    return sid
+
+
+def is_fuzzy_studentID(a: str, b: str) -> bool:
+    """两个学号是否相近（编辑距离不超过1），均以't'或'T'结尾时只比较数字部分"""
+    if len(a) < 4 or len(b) < 4: return False
+    if a.endswith(('t', 'T')) and b.endswith(('t', 'T')):
+        return match_by(a[:-1], b[:-1], LEVEL.High)
+    else:
+        return match_by(a, b, LEVEL.High)
+
+
+class RosterIndex:
+    """
+    总名单索引，按照(班级名, 规范学号)与(班级名, 姓名)建立哈希表
+    索引中保存的是总名单人员的引用
+    """
+
+    def __init__(self, persons: list[DefPerson] = None):
+        """
+        Args:
+            persons:建立索引的人员列表
+        """
+        self.__by_id: dict[tuple[str, str], list[DefPerson]] = {}
+        """(班级名, 规范学号) -> 人员"""
+        self.__by_name: dict[tuple[str, str], list[DefPerson]] = {}
+        """(班级名, 姓名) -> 人员"""
+        self.__order: dict[int, int] = {}
+        """id(人员) -> 加入索引的顺序"""
+        self.__fuzzy: dict[str, tuple[BKTree, BKTree]] = {}
+        """班级名 -> (学号BK树, 姓名BK树)，首次模糊查找该班级时建立"""
+        if persons is not None:
+            self.extend(persons)
+
+    def __len__(self):
+        return len(self.__order)
+
+    def clear(self):
+        """清空索引"""
+        self.__by_id.clear()
+        self.__by_name.clear()
+        self.__order.clear()
+        self.__fuzzy.clear()
+
+    def rebuild(self, persons: list[DefPerson]):
+        """按照persons重建索引"""
+        self.clear()
+        self.extend(persons)
+
+    def add(self, per: DefPerson):
+        """添加一个人员，同键的人员按照添加顺序保存"""
+        cid = canonical_studentID(per.studentID)
+        if cid is not None:
+            self.__by_id.setdefault((per.classname, cid), []).append(per)
+        self.__by_name.setdefault((per.classname, per.name), []).append(per)
+        self.__order[id(per)] = len(self.__order)
+        self.__fuzzy.pop(per.classname, None)  # 该班级的模糊索引失效
+
+    def extend(self, persons: list[DefPerson]):
+        """添加多个人员"""
+        for per in persons:
+            self.add(per)
+
+    def find_by_studentID(self, classname: str, studentID: str) -> list[DefPerson]:
+        """按照班级与学号查找，学号规则同is_same_studentID"""
+        cid = canonical_studentID(studentID)
+        if cid is None: return []
+        return self.__by_id.get((classname, cid), [])
+
+    def find_by_name(self, classname: str, name: str) -> list[DefPerson]:
+        """按照班级与姓名查找"""
+        return self.__by_name.get((classname, name), [])
+
+    def join_by_studentID(
+        self,
+        persons: list[DefPerson]) -> tuple[list[tuple[DefPerson, list[DefPerson]]], list[DefPerson]]:
+        """
+        按照(班级名, 规范学号)与索引做哈希连接
+        Args:
+            persons:需要连接的人员（如storage.xlsx中的人员）
+        Returns:
+            (连接成功的(人员, 总名单中同学号的全部人员), 未能连接的人员)
+        """
+        joined: list[tuple[DefPerson, list[DefPerson]]] = []
+        missed: list[DefPerson] = []
+        for per in persons:
+            same_id = self.find_by_studentID(per.classname, per.studentID)
+            if len(same_id) > 0:
+                joined.append((per, same_id))
+            else:
+                missed.append(per)
+        return joined, missed
+
+    def __get_fuzzy(self, classname: str) -> tuple[BKTree, BKTree]:
+        """获取班级的模糊索引，不存在时建立"""
+        trees = self.__fuzzy.get(classname, None)
+        if trees is not None: return trees
+        id_tree = BKTree()
+        name_tree = BKTree()
+        for (cn, _), pers in self.__by_name.items():
+            if cn != classname: continue
+            for per in pers:
+                if len(per.studentID) >= 4:
+                    id_tree.add(per.studentID, per)
+                name_tree.add(per.name, per)
+        trees = (id_tree, name_tree)
+        self.__fuzzy[classname] = trees
+        return trees
+
+    def find_likely(self, target: DefPerson) -> list[DefPerson]:
+        """
+        查找同班级中与目标相近的人员：学号相近（is_fuzzy_studentID）或姓名编辑距离不超过1
+        Returns:
+            按照加入索引的顺序排列的总名单人员引用
+        """
+        id_tree, name_tree = self.__get_fuzzy(target.classname)
+        likely: dict[int, DefPerson] = {}
+        sid = target.studentID
+        if len(sid) >= 4:
+            # 两端均以T结尾时只比较数字部分，完整学号的距离至多再大1
+            k = 2 if sid.endswith(('t', 'T')) else 1
+            for _, per in id_tree.query(sid, k):
+                if is_fuzzy_studentID(sid, per.studentID):
+                    likely[id(per)] = per
+        if isinstance(target.name, str):
+            for _, per in name_tree.query(target.name, LEVEL.High.value):
+                likely[id(per)] = per
+        return sorted(likely.values(), key = lambda x: self.__order[id(x)])
+
+    def search(self, target: DefPerson) -> DefPerson | None:
+        """
+        搜索目标人员
+        1.同班级同学号，返回最先加入索引的人员
+        2.同班级内有且仅有一个同名人员，返回此人员
+        Returns:
+            总名单人员的引用，未找到时返回None
+        """
+        same_id = self.find_by_studentID(target.classname, target.studentID)
+        if len(same_id) > 0:
+            return same_id[0]
+        same_name = self.find_by_name(target.classname, target.name)
+        if len(same_name) == 1:
+            return same_name[0]
+        return None
+
+
+def group_by_studentID(persons: list[DefPerson]) -> list[list[DefPerson]]:
+    """
+    按照规范学号对人员分组，单次遍历
+    组的顺序为组内第一个人员出现的顺序，组内人员保持原顺序
+    学号无法比较的人员单独成组
+    Args:
+        persons:人员列表
+    Returns:
+        分组后的人员
+    """
+    groups: list[list[DefPerson]] = []
+    by_id: dict[str, list[DefPerson]] = {}
+    for per in persons:
+        cid = canonical_studentID(per.studentID)
+        if cid is None:
+            groups.append([per, ])
+            continue
+        g = by_id.get(cid, None)
+        if g is None:
+            g = [per, ]
+            by_id[cid] = g
+            groups.append(g)
+        else:
+            g.append(per)
+    return groups
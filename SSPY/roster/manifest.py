@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""运行清单：记录各班级各报表的输入摘要，只重新生成输入变化了的报表"""
+import hashlib
+import json
+import os
+
+
+def file_fingerprint(path: str) -> tuple[str, int, int]:
+    """文件的(路径, 大小, 修改时间)，文件不存在时大小与时间为-1"""
+    try:
+        st = os.stat(path)
+        return path, st.st_size, st.st_mtime_ns
+    except OSError:
+        return path, -1, -1
+
+
+class RunManifest:
+    """
+    运行清单，按照(报表类型, 班级名)保存输入的摘要以及少量附带数据（如该班的未知人员行）
+    摘要未变且输出文件仍然存在的报表视为干净，可以跳过重建与保存
+    """
+
+    def __init__(self, path: str, force: bool = False):
+        """
+        Args:
+            path:清单文件路径，不存在或损坏时视为空清单
+            force:强制全部重建，仍会记录新的摘要
+        """
+        self.__path = path
+        self.__force = force
+        self.__entries: dict[str, dict[str, dict]] = {}
+        """报表类型 -> 班级名 -> {'digest': 摘要, ...}"""
+        try:
+            with open(path, 'r', encoding = 'utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.__entries = data
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def force(self) -> bool:
+        return self.__force
+
+    @staticmethod
+    def digest(*parts) -> str:
+        """输入的摘要，parts应由str、数字、list/tuple等可以JSON序列化的值组成"""
+        h = hashlib.sha1()
+        for part in parts:
+            h.update(json.dumps(part, ensure_ascii = False, default = str).encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def is_clean(self, report: str, key: str, digest: str, outputs: list[str] = ()) -> bool:
+        """
+        报表是否不需要重建
+        Args:
+            report:报表类型
+            key:班级名
+            digest:本次输入的摘要
+            outputs:报表的输出文件，任意一个不存在时需要重建
+        """
+        if self.__force: return False
+        entry = self.__entries.get(report, {}).get(key, None)
+        if entry is None or entry.get('digest', None) != digest: return False
+        return all(os.path.exists(p) for p in outputs)
+
+    def dirty(self, report: str, digests: dict[str, str], outputs: dict[str, list[str]] = None) -> list[str]:
+        """
+        需要重建的班级名，按照digests的顺序
+        Args:
+            report:报表类型
+            digests:班级名 -> 摘要
+            outputs:班级名 -> 输出文件
+        """
+        if outputs is None: outputs = {}
+        return [k for k, d in digests.items() if not self.is_clean(report, k, d, outputs.get(k, ()))]
+
+    def get(self, report: str, key: str, name: str, default = None):
+        """读取附带数据"""
+        return self.__entries.get(report, {}).get(key, {}).get(name, default)
+
+    def update(self, report: str, key: str, digest: str, **extra):
+        """记录重建后的摘要与附带数据"""
+        entry = {'digest': digest}
+        entry.update(extra)
+        self.__entries.setdefault(report, {})[key] = entry
+
+    def save(self):
+        """写入清单文件（先写临时文件再替换，避免中断时损坏）"""
+        tmp = self.__path + '.tmp'
+        with open(tmp, 'w', encoding = 'utf-8') as f:
+            json.dump(self.__entries, f, ensure_ascii = False)
+        os.replace(tmp, self.__path)
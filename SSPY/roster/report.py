@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""分班报表"""
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .table import RosterTable
+
+
+class RosterReport:
+    """
+    分班报表：一次遍历总名单，每人只投影一次并同时按班级分组
+    总表与各班级表一起产生，代价为O(总名单)而不是O(班级数×总名单)
+    """
+
+    def __init__(
+        self,
+        table: RosterTable,
+        header: list[str],
+        mask: np.ndarray = None,
+        classes: Callable[[int], Iterable[str]] = None):
+        """
+        Args:
+            table:列式总名单
+            header:提取标准（不含表头行）
+            mask:筛选掩码，默认为全部
+            classes:由总名单行号得到所属班级名的函数，一人可属于多个班级；默认为该行的青字班
+        """
+        self.__table = table
+        self.__index: list[int] = (
+            list(range(len(table))) if mask is None else np.flatnonzero(mask).tolist())
+        """参与报表的总名单行号"""
+        self.__rows = table.project(header, rows = self.__index)
+        self.__groups: dict[str, list[int]] = {}
+        """班级名 -> 该班在rows中的位置，班级按首次出现的顺序"""
+
+        if classes is None:
+            codes = table.class_codes[self.__index]
+            cns = table.classnames
+            for c in dict.fromkeys(codes.tolist()):
+                self.__groups[cns[c]] = np.flatnonzero(codes == c).tolist()
+            return
+        for pos, i in enumerate(self.__index):
+            for cn in classes(i):
+                group = self.__groups.get(cn, None)
+                if group is None:
+                    group = []
+                    self.__groups[cn] = group
+                group.append(pos)
+
+    def __len__(self):
+        return len(self.__rows)
+
+    @property
+    def rows(self) -> list[list[str]]:
+        """总表的行（保持总名单顺序），可以直接修改"""
+        return self.__rows
+
+    @property
+    def classnames(self) -> list[str]:
+        """出现过的班级名，按照首次出现的顺序"""
+        return list(self.__groups.keys())
+
+    def indices(self, classname: str) -> list[int]:
+        """某班级各行在总名单中的行号"""
+        return [self.__index[p] for p in self.__groups.get(classname, [])]
+
+    def class_rows(self, classname: str, copy: bool = False) -> list[list[str]]:
+        """
+        某班级的行，保持总名单顺序，班级不存在时为空
+        Args:
+            classname:班级名
+            copy:是否浅拷贝每一行；同一行会出现在多个表中并被分别修改时需要
+        """
+        rows = self.__rows
+        pos = self.__groups.get(classname, [])
+        if copy:
+            return [list(rows[p]) for p in pos]
+        return [rows[p] for p in pos]
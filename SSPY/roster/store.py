@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""人员的嵌入式储存（SQLite）"""
+import json
+import sqlite3
+import time
+from typing import Iterable
+
+from SSPY.PersonneInformation import DefPerson
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS persons (
+    pid INTEGER PRIMARY KEY,
+    classname TEXT NOT NULL,
+    studentID TEXT NOT NULL,
+    name TEXT NOT NULL,
+    info TEXT NOT NULL DEFAULT '{}',
+    UNIQUE (classname, studentID, name)
+);
+CREATE INDEX IF NOT EXISTS idx_persons_class_sid ON persons (classname, studentID);
+CREATE INDEX IF NOT EXISTS idx_persons_name ON persons (name);
+CREATE TABLE IF NOT EXISTS sessions (
+    session INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attendance (
+    session INTEGER NOT NULL REFERENCES sessions (session),
+    pid INTEGER NOT NULL REFERENCES persons (pid),
+    ifsign INTEGER NOT NULL DEFAULT 0,
+    ifcheck INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session, pid)
+) WITHOUT ROWID;
+"""
+"""表结构：persons为人员，sessions为活动场次，attendance为每场的报名与签到标志"""
+
+_UPSERT_PERSON = """
+INSERT INTO persons (classname, studentID, name, info) VALUES (?, ?, ?, ?)
+ON CONFLICT (classname, studentID, name) DO UPDATE SET info = excluded.info
+"""
+_UPSERT_ATTENDANCE = """
+INSERT INTO attendance (session, pid, ifsign, ifcheck)
+SELECT ?, pid, ?, ? FROM persons WHERE classname = ? AND studentID = ? AND name = ?
+ON CONFLICT (session, pid) DO UPDATE SET
+    ifsign = max(ifsign, excluded.ifsign),
+    ifcheck = max(ifcheck, excluded.ifcheck)
+"""
+
+
+def _key(per: DefPerson) -> tuple[str, str, str]:
+    """人员在储存中的键(班级名, 学号, 姓名)"""
+    return per.classname, per.studentID, per.name
+
+
+def _info(per: DefPerson) -> str:
+    return json.dumps(dict(per.information), ensure_ascii = False, default = str)
+
+
+class PersonStore:
+    """
+    人员的嵌入式储存，取代storage.xlsx在功能1与功能2之间传递报名信息
+    人员按(班级名, 学号, 姓名)唯一，并按(班级名, 学号)与姓名建立索引；
+    每次活动为一个场次，各场次的报名与签到标志分别保存，历史会一直累积
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path:数据库文件路径，不存在时创建
+        """
+        self.__path = path
+        self.__conn = sqlite3.connect(path)
+        self.__conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.__conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def __len__(self):
+        return self.__conn.execute('SELECT count(*) FROM persons').fetchone()[0]
+
+    def upsert_persons(self, persons: Iterable[DefPerson]) -> int:
+        """
+        批量写入人员（如总名单），已存在的人员更新其信息
+        Returns:
+            写入的人员数量
+        """
+        rows = [(*_key(per), _info(per)) for per in persons]
+        with self.__conn:
+            self.__conn.executemany(_UPSERT_PERSON, rows)
+        return len(rows)
+
+    def new_session(self, title: str = None) -> int:
+        """
+        开始新的活动场次
+        Args:
+            title:场次名，默认为当前时间
+        Returns:
+            场次编号
+        """
+        created = time.strftime('%Y-%m-%d %H:%M:%S')
+        with self.__conn:
+            cur = self.__conn.execute(
+                'INSERT INTO sessions (title, created) VALUES (?, ?)', (title or created, created))
+        return cur.lastrowid
+
+    def latest_session(self) -> int | None:
+        """最近的场次编号，没有场次时为None"""
+        return self.__conn.execute('SELECT max(session) FROM sessions').fetchone()[0]
+
+    def sessions(self) -> list[tuple[int, str, str]]:
+        """全部场次(编号, 场次名, 创建时间)，按时间先后"""
+        return self.__conn.execute('SELECT session, title, created FROM sessions ORDER BY session').fetchall()
+
+    def record(self, session: int, persons: Iterable[DefPerson]) -> int:
+        """
+        批量记录人员在某场次的报名与签到标志，人员不存在时一并写入；
+        标志只会由假变真，同一场次多次记录不会撤销已有的报名或签到
+        Args:
+            session:场次编号
+            persons:人员，使用其ifsign与ifcheck
+        Returns:
+            记录的人员数量
+        """
+        persons = list(persons)
+        keys = [_key(per) for per in persons]
+        with self.__conn:
+            self.__conn.executemany(
+                'INSERT INTO persons (classname, studentID, name, info) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (classname, studentID, name) DO NOTHING',
+                [(*k, _info(per)) for k, per in zip(keys, persons)])
+            self.__conn.executemany(
+                _UPSERT_ATTENDANCE,
+                [(session, int(per.ifsign), int(per.ifcheck), *k) for k, per in zip(keys, persons)])
+        return len(persons)
+
+    def __persons(self, sql: str, params: tuple) -> list[DefPerson]:
+        pers: list[DefPerson] = []
+        for classname, studentID, name, info, ifsign, ifcheck in self.__conn.execute(sql, params):
+            per = DefPerson(classname, name, studentID)
+            for k, v in json.loads(info).items():
+                per.set_information(k, v)
+            per.ifsign = bool(ifsign)
+            per.ifcheck = bool(ifcheck)
+            pers.append(per)
+        return pers
+
+    def attendees(self, session: int = None, ifsign: bool = None, ifcheck: bool = None) -> list[DefPerson]:
+        """
+        某场次记录过的人员，按照记录顺序
+        Args:
+            session:场次编号，默认为最近的场次
+            ifsign:只取报名（或未报名）的人员，None为不限
+            ifcheck:只取签到（或未签到）的人员，None为不限
+        """
+        if session is None: session = self.latest_session()
+        if session is None: return []
+        sql = ('SELECT p.classname, p.studentID, p.name, p.info, a.ifsign, a.ifcheck '
+               'FROM attendance a JOIN persons p ON p.pid = a.pid WHERE a.session = ?')
+        params: list = [session]
+        if ifsign is not None:
+            sql += ' AND a.ifsign = ?'
+            params.append(int(ifsign))
+        if ifcheck is not None:
+            sql += ' AND a.ifcheck = ?'
+            params.append(int(ifcheck))
+        return self.__persons(sql + ' ORDER BY p.pid', tuple(params))
+
+    def find(self, classname: str = None, studentID: str = None, name: str = None) -> list[DefPerson]:
+        """
+        按照班级名、学号、姓名精确查找人员（不含场次标志），参数为None时不限
+        """
+        conds: list[str] = []
+        params: list[str] = []
+        for col, v in (('classname', classname), ('studentID', studentID), ('name', name)):
+            if v is not None:
+                conds.append(f'{col} = ?')
+                params.append(v)
+        sql = 'SELECT classname, studentID, name, info, 0, 0 FROM persons'
+        if conds: sql += ' WHERE ' + ' AND '.join(conds)
+        return self.__persons(sql + ' ORDER BY pid', tuple(params))
+
+    def history(self, classname: str, studentID: str) -> list[tuple[int, bool, bool]]:
+        """某人在各场次的(场次编号, 是否报名, 是否签到)"""
+        return [(s, bool(a), bool(b)) for s, a, b in self.__conn.execute(
+            'SELECT a.session, a.ifsign, a.ifcheck FROM attendance a JOIN persons p ON p.pid = a.pid '
+            'WHERE p.classname = ? AND p.studentID = ? ORDER BY a.session', (classname, studentID))]
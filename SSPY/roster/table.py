@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""列式总名单"""
+import numpy as np
+
+from SSPY.globalconstants import GlobalConstants as gc
+from SSPY.PersonneInformation import DefPerson
+
+
+class RosterTable:
+    """
+    列式储存的总名单：每个信息键一列，班级名使用类别编码，ifsign/ifcheck使用布尔数组
+    筛选与计数是数组掩码运算，投影按列进行，不再逐个调用DefPerson的方法
+    """
+
+    def __init__(self):
+        self.__size = 0
+        self.__columns: dict[str, list[str | None]] = {}
+        """信息键 -> 列，人员没有此键时为None"""
+        self.__filepaths: list[str] = []
+        """文件地址列（已转换为字符串）"""
+        self.__classnames: list[str] = []
+        """班级名的类别"""
+        self.__class_codes = np.zeros(0, dtype = np.int32)
+        """每行班级名在__classnames中的编码"""
+        self.__ifsign = np.zeros(0, dtype = bool)
+        self.__ifcheck = np.zeros(0, dtype = bool)
+
+    @classmethod
+    def from_persons(cls, persons: list[DefPerson]) -> 'RosterTable':
+        """由人员列表建立列式总名单（快照）"""
+        table = cls()
+        n = len(persons)
+        table.__size = n
+        table.__ifsign = np.fromiter((per.ifsign for per in persons), dtype = bool, count = n)
+        table.__ifcheck = np.fromiter((per.ifcheck for per in persons), dtype = bool, count = n)
+        category: dict[str, int] = {}
+        codes = np.empty(n, dtype = np.int32)
+        for i, per in enumerate(persons):
+            cn = per.classname
+            code = category.get(cn, None)
+            if code is None:
+                code = len(category)
+                category[cn] = code
+            codes[i] = code
+            for k, v in per.information.items():
+                col = table.__columns.get(k, None)
+                if col is None:
+                    col = [None] * n
+                    table.__columns[k] = col
+                col[i] = v
+            table.__filepaths.append(per.get_information(gc.chstrFilePath))
+        table.__classnames = list(category.keys())
+        table.__class_codes = codes
+        return table
+
+    def refresh_flags(self, persons: list[DefPerson]):
+        """
+        原地刷新ifsign/ifcheck两列，不重新读取人员信息
+        Args:
+            persons:建立快照时的人员列表，顺序与长度不变
+        """
+        if len(persons) != self.__size:
+            raise ValueError(f'人员数量{len(persons)}与总名单行数{self.__size}不一致')
+        self.__ifsign = np.fromiter((per.ifsign for per in persons), dtype = bool, count = self.__size)
+        self.__ifcheck = np.fromiter((per.ifcheck for per in persons), dtype = bool, count = self.__size)
+
+    def __len__(self):
+        return self.__size
+
+    @property
+    def classnames(self) -> list[str]:
+        """出现过的班级名，按照首次出现的顺序"""
+        return list(self.__classnames)
+
+    @property
+    def class_codes(self) -> np.ndarray:
+        """每行班级名在classnames中的编码"""
+        return self.__class_codes
+
+    @property
+    def ifsign(self) -> np.ndarray:
+        return self.__ifsign
+
+    @property
+    def ifcheck(self) -> np.ndarray:
+        return self.__ifcheck
+
+    def mask(
+        self,
+        classname: str = None,
+        ifsign: bool = None,
+        ifcheck: bool = None) -> np.ndarray:
+        """
+        生成筛选掩码，参数为None时不参与筛选
+        Args:
+            classname:班级名
+            ifsign:是否报名
+            ifcheck:是否签到
+        """
+        m = np.ones(self.__size, dtype = bool)
+        if classname is not None:
+            if classname in self.__classnames:
+                m &= (self.__class_codes == self.__classnames.index(classname))
+            else:
+                m[:] = False
+        if ifsign is not None:
+            m &= (self.__ifsign == ifsign)
+        if ifcheck is not None:
+            m &= (self.__ifcheck == ifcheck)
+        return m
+
+    def count(self, mask: np.ndarray = None) -> int:
+        """掩码内的人数"""
+        if mask is None: return self.__size
+        return int(np.count_nonzero(mask))
+
+    def column(self, inkey: str, rows: np.ndarray | list[int] = None) -> list[str]:
+        """
+        取出一列，取值规则与DefPerson.get_information相同
+        Args:
+            inkey:信息键
+            rows:行号，默认为全部
+        """
+        if rows is None: rows = range(self.__size)
+        raw = self.__columns.get(inkey, None)
+        key = DefPerson.get_stdkey(inkey)
+        if key == gc.chstrQClassname:
+            cns = self.__classnames
+            fallback = [cns[c] for c in self.__class_codes.tolist()]
+        elif key == gc.chstrFilePath:
+            fallback = self.__filepaths
+        elif key is not None:
+            fallback = self.__columns.get(key, None)
+        else:
+            fallback = None
+        out: list[str] = []
+        for i in rows:
+            v = raw[i] if raw is not None else None
+            if v is None:
+                v = fallback[i] if fallback is not None else None
+            out.append('' if v is None else v)
+        return out
+
+    def project(
+        self,
+        header: list[str],
+        mask: np.ndarray = None,
+        rows: list[int] = None) -> list[list[str]]:
+        """
+        按照表头投影出表格（不含表头），等价于对掩码内的每个人员调用to_list(header)
+        Args:
+            header:提取标准
+            mask:筛选掩码，默认为全部
+            rows:直接指定行号，优先于mask
+        """
+        if rows is None:
+            rows = range(self.__size) if mask is None else np.flatnonzero(mask).tolist()
+        cols = [self.column(h, rows) for h in header]
+        return [list(r) for r in zip(*cols)] if len(cols) > 0 else [[] for _ in rows]
@@ -29,15 +29,20 @@ if getattr(sys, 'frozen', False) and sys.platform == 'win32':
 
 #-----------------------------------正常入口-------------------------------------------#
 
-from wxGUI.SSPYframe import SSPYMainFrame
-from wx import App
+if __name__ == '__main__':
+    # 多进程解析时子进程会重新导入入口文件，界面只在主进程中启动
+    from multiprocessing import freeze_support
+    freeze_support()
 
+    from wxGUI.SSPYframe import SSPYMainFrame
+    from wx import App
 
-app = App()
-from QingziClass.doqingziclass import DoQingziClass
 
-SSPYMainFrame(None, title = "SmartSheetPY", QC = DoQingziClass())
-app.MainLoop()
+    app = App()
+    from QingziClass.doqingziclass import DoQingziClass
+
+    SSPYMainFrame(None, title = "SmartSheetPY", QC = DoQingziClass())
+    app.MainLoop()
 
 
 # os.system('chcp 65001')
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """历史搜索记录"""
-import copy
-from copy import deepcopy
+from SSPY.helperfunction import FrozenList, freeze
 
 
 class ASearch:
@@ -16,7 +15,7 @@ class ASearch:
         """
         self.__target = target
         self.__root = root
-        self.__rst = copy.deepcopy(rst)
+        self.__rst = freeze(rst)
 
     @property
     def target(self):
@@ -29,9 +28,9 @@ class ASearch:
         return self.__root
 
     @property
-    def rst(self):
-        """搜索的结果"""
-        return deepcopy(self.__rst)
+    def rst(self) -> FrozenList:
+        """搜索的结果（只读快照，需要修改时调用copy()）"""
+        return self.__rst
 
     def is_same(self, target: str, root: str):
         """判断是否为同一次搜索"""
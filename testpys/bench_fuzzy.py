@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""模糊匹配内核的性能对比：完整DP、有上界的带状DP与批量DP"""
+import random
+import timeit
+
+from SSPY.fuzzy.search import levenshtein_distance, levenshtein_within, LEVEL, EncodedStrings, distances
+
+
+def _names(n: int) -> list[str]:
+    """随机生成2~4字的中文姓名"""
+    chars = '张王李赵刘陈杨黄周吴徐孙马朱胡郭何林罗高郑梁谢宋唐许韩冯邓曹彭曾萧田董潘袁蔡蒋余于杜叶程魏苏吕丁任沈姚卢姜崔钟谭陆汪范金石廖贾夏韦付方白邹孟熊秦邱江尹薛闫段雷侯龙史陶黎贺顾毛郝龚邵万钱严覃武戴莫孔向汤'
+    return [''.join(random.choice(chars) for _ in range(random.randint(2, 4))) for _ in range(n)]
+
+
+def _ids(n: int) -> list[str]:
+    """随机生成10~13位学号"""
+    return [''.join(random.choice('0123456789') for _ in range(random.randint(10, 13))) for _ in range(n)]
+
+
+def bench(title: str, lib: list[str], k: int = LEVEL.High.value, number: int = 5):
+    target = lib[0]
+    full = timeit.timeit(lambda: [levenshtein_distance(target, s) <= k for s in lib], number = number)
+    band = timeit.timeit(lambda: [levenshtein_within(target, s, k) <= k for s in lib], number = number)
+    print(f'{title}: {len(lib)}条  完整DP {full / number * 1000:.1f}ms  '
+          f'带状DP {band / number * 1000:.1f}ms  加速 {full / band:.1f}x')
+
+
+def bench_batch(title: str, lib: list[str], number: int = 5):
+    target = lib[0]
+    enc = EncodedStrings(lib)
+    band = timeit.timeit(lambda: [levenshtein_within(target, s, LEVEL.High.value) for s in lib], number = number)
+    batch = timeit.timeit(lambda: distances(target, enc), number = number)
+    encode = timeit.timeit(lambda: EncodedStrings(lib), number = number)
+    print(f'{title}: {len(lib)}条  带状DP {band / number * 1000:.1f}ms  '
+          f'批量DP {batch / number * 1000:.1f}ms（编码一次 {encode / number * 1000:.1f}ms）')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    bench('中文姓名', _names(20000))
+    bench('学号', _ids(20000))
+    bench_batch('中文姓名', _names(50000))
+    bench_batch('学号', _ids(50000))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+PdfLoad（打开一次，PyMuPDF表格识别）与pdfplumber表格+PyMuPDF文字两次打开的吞吐量对比（页/秒），
+以及附有证书、成绩单的长报名表按关键词筛选页面前后的耗时
+"""
+import os
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+import pdfplumber
+
+from SSPY.helperfunction import clean_enter, clean_space
+from SSPY.myff.document.pdf import PdfStream
+from SSPY.mypdf import PdfLoad
+from SSPY.parseperson import FORM_ANCHORS
+
+PAGES = 40
+"""测试文件的页数"""
+N = 5
+"""每种方法解析的次数"""
+
+
+def draw_table(page, title: str, keys: list[str], n: int):
+    """在页面上绘制一个8×4的有框线表格与一行说明文字"""
+    page.insert_text((50, 30), title, fontname = 'china-s')
+    for r in range(8):
+        for c in range(4):
+            rect = fitz.Rect(50 + c * 120, 50 + r * 40, 170 + c * 120, 90 + r * 40)
+            page.draw_rect(rect, color = (0, 0, 0))
+            text = keys[c] if c % 2 == 0 else f'值{n}-{r}-{c}'
+            page.insert_text((rect.x0 + 5, rect.y0 + 25), text, fontname = 'china-s')
+
+
+def make_forms(path: str):
+    """生成多页报名表，每页一个表格"""
+    doc = fitz.open()
+    for n in range(PAGES):
+        draw_table(doc.new_page(), f'第{n + 1}页 青字班班委报名表', ['姓名', '学号', '应聘岗位', '学院'], n)
+    doc.save(path)
+
+
+def make_long_form(path: str, pages: int):
+    """
+    生成附有证书与成绩单的报名表：前pages-1页为成绩单（同样是表格），最后一页为报名表
+    成绩单表头的字隔开书写（"职 务"、"岗 位"），单个的字不应使页面通过关键词筛选
+    """
+    doc = fitz.open()
+    for n in range(pages - 1):
+        draw_table(doc.new_page(), f'成绩单 第{n + 1}页', ['课程', '职 务', '成绩', '岗 位'], n)
+    draw_table(doc.new_page(), '青字班班委报名表', ['姓名', '学号', '应聘岗位', '学院'], pages)
+    doc.save(path)
+
+
+def timed(title: str, func):
+    t0 = time.perf_counter()
+    for _ in range(N):
+        out = func()
+    print(f'{title} {(time.perf_counter() - t0) / N * 1000:.1f} ms/份')
+    return out
+
+
+def open_twice(path: str):
+    """pdfplumber提取表格，再用PyMuPDF打开一次提取文字"""
+    with pdfplumber.open(path) as pdf:
+        tables = []
+        for page in pdf.pages:
+            tables.extend(page.extract_tables())
+    pages = []
+    with fitz.open(path) as pdf:
+        for page in pdf:
+            pages.append([clean_space(span['text'], '')
+                          for block in page.get_text('dict')['blocks'] if block['type'] == 0
+                          for line in block['lines'] for span in line['spans']])
+    return clean_enter(tables, ''), pages
+
+
+def throughput(title: str, func, path: str):
+    t0 = time.perf_counter()
+    for _ in range(N):
+        out = func(path)
+    dt = time.perf_counter() - t0
+    print(f'{title} {N * PAGES / dt:.1f} 页/秒')
+    return out
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, '报名表.pdf')
+        make_forms(path)
+        tables, pages = throughput('pdfplumber表格 + PyMuPDF文字（打开两次）', open_twice, path)
+        pdf = throughput('PdfLoad(table_only = False)', lambda p: PdfLoad(p, table_only = False), path)
+        throughput('PdfLoad(table_only = True)', PdfLoad, path)
+        assert [list(map(list, t)) for t in pdf.sheets] == tables
+        assert [list(p) for p in pdf.pages] == pages
+
+        short = os.path.join(d, '单页报名表.pdf')
+        long = os.path.join(d, '附成绩单报名表.pdf')
+        make_long_form(short, 1)
+        make_long_form(long, PAGES)
+        a = timed(f'{PAGES}页 PdfLoad', lambda: PdfLoad(long).get_sheet('应聘岗位', True))
+        b = timed(f'{PAGES}页 PdfLoad(anchors)', lambda: PdfLoad(long, anchors = ['应聘岗位']).get_sheet('应聘岗位', True))
+        timed('1页 PdfLoad(anchors)', lambda: PdfLoad(short, anchors = ['应聘岗位']).get_sheet('应聘岗位', True))
+        assert a == b
+        # 只有最后一页（报名表）识别表格
+        assert PdfStream(long, text = False, keywords = FORM_ANCHORS).table_pages == [PAGES - 1]
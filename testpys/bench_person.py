@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""DefPerson的内存与时间开销（每10万人）"""
+import copy
+import time
+import tracemalloc
+
+from SSPY.PersonneInformation import DefPerson
+
+N = 100000
+
+
+def make(i: int) -> DefPerson:
+    per = DefPerson('青书班', '张三' + str(i % 1000), str(2024000000 + i))
+    per.set_information('学院', '计算机学院')
+    per.set_information('联系方式', str(13800000000 + i))
+    per.set_information('报名方式', '自主报名')
+    return per
+
+
+if __name__ == '__main__':
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    pers = [make(i) for i in range(N)]
+    t1 = time.perf_counter()
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'创建 {(t1 - t0) * 1000:.0f}ms  内存 {mem / 1024 / 1024:.1f}MiB')
+
+    t0 = time.perf_counter()
+    cps = [copy.deepcopy(p) for p in pers]
+    t1 = time.perf_counter()
+    print(f'深拷贝 {(t1 - t0) * 1000:.0f}ms')
+
+    t0 = time.perf_counter()
+    for a, b in zip(pers, cps):
+        a.merge(b)
+    t1 = time.perf_counter()
+    print(f'合并 {(t1 - t0) * 1000:.0f}ms')
+
+    t0 = time.perf_counter()
+    for p in pers:
+        p.to_list(['姓名', '学号', '学院', '联系方式'])
+    t1 = time.perf_counter()
+    print(f'to_list {(t1 - t0) * 1000:.0f}ms')
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""只读快照与深拷贝访问器的开销对比（__load_person_all与preload_*路径）"""
+import copy
+import os
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from SSPY.myxlsx import XlsxLoad
+from SSPY.datastorage import XLSXDataStorage
+
+N = 20000
+
+
+def make_roster(path: str):
+    """生成一个N行的总名单"""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(['序号', '姓名', '学号', '学院', '联系方式'])
+    for i in range(N):
+        ws.append([i + 1, '张三' + str(i % 1000), str(2024000000 + i), '计算机学院', str(13800000000 + i)])
+    wb.save(path)
+
+
+def timed(title: str, func):
+    t0 = time.perf_counter()
+    func()
+    print(f'{title} {(time.perf_counter() - t0) * 1000:.0f}ms')
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, '青书班.xlsx')
+        make_roster(path)
+        x = XlsxLoad(path, classname = '青书班')
+        timed('get_personList', x.get_personList)
+        timed('sheets 只读快照', lambda: x.sheets)
+        timed('sheets 深拷贝（旧访问器）', lambda: copy.deepcopy(x.sheets))
+        timed('XLSXDataStorage(sheets = x.sheets)', lambda: XLSXDataStorage(path, sheets = x.sheets).sheets)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""原生流式xlsx读取器与openpyxl只读模式的性能对比"""
+import os
+import random
+import tempfile
+import time
+import zipfile
+
+from openpyxl import load_workbook
+
+from SSPY.myxlsx import XlsxStreamReader, XlsxLoad
+
+N = 50000
+"""名单行数"""
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '</Types>')
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="xl/workbook.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>')
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>')
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+    '<Relationship Id="rId2" Target="sharedStrings.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"/>'
+    '</Relationships>')
+
+
+def make_roster(path: str):
+    """生成一个与Excel保存的文件结构相同（使用共享字符串表）的总名单"""
+    header = ['序号', '姓名', '学号', '学院', '专业', '电话', 'QQ号', '所任职务']
+    academies = ['计算机学院', '电子信息学院', '机械学院', '经济管理学院', '外国语学院']
+    strings: dict[str, int] = {}
+
+    def sst(s: str) -> int:
+        return strings.setdefault(s, len(strings))
+
+    def cell(ref: str, v) -> str:
+        if isinstance(v, int):
+            return f'<c r="{ref}"><v>{v}</v></c>'
+        return f'<c r="{ref}" t="s"><v>{sst(v)}</v></c>'
+
+    rows = []
+    for i, r in enumerate([header] + [
+        [i, '学员' + str(i), str(2024000000 + i), random.choice(academies), '专业' + str(i % 50),
+         str(13800000000 + i), str(100000 + i), random.choice(['班长', '团支书', '无'])]
+        for i in range(1, N + 1)], 1):
+        rows.append(f'<row r="{i}">' + ''.join(cell(f'{chr(65 + j)}{i}', v) for j, v in enumerate(r)) + '</row>')
+    sheet = ('<?xml version="1.0" encoding="UTF-8"?>'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             f'<dimension ref="A1:H{N + 1}"/><sheetData>' + ''.join(rows) + '</sheetData></worksheet>')
+    shared = ('<?xml version="1.0" encoding="UTF-8"?>'
+              '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+              + ''.join(f'<si><t>{s}</t></si>' for s in strings) + '</sst>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        z.writestr('_rels/.rels', _RELS)
+        z.writestr('xl/workbook.xml', _WORKBOOK)
+        z.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+        z.writestr('xl/worksheets/sheet1.xml', sheet)
+        z.writestr('xl/sharedStrings.xml', shared)
+
+
+def timed(title: str, func):
+    t0 = time.perf_counter()
+    out = func()
+    print(f'{title} {time.perf_counter() - t0:.2f}s')
+    return out
+
+
+def openpyxl_rows(path: str) -> list:
+    wb = load_workbook(path, data_only = True, read_only = True)
+    rows = list(wb.worksheets[0].iter_rows(values_only = True))
+    wb.close()
+    return rows
+
+
+def native_rows(path: str, columns: list[int] = None) -> list:
+    with XlsxStreamReader(path) as reader:
+        return list(reader.rows(0, columns))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, '青书班.xlsx')
+        make_roster(path)
+        print(f'{N}行 × 8列')
+        a = timed('openpyxl read_only', lambda: openpyxl_rows(path))
+        b = timed('XlsxStreamReader', lambda: native_rows(path))
+        timed('XlsxStreamReader 只取姓名/学号', lambda: native_rows(path, [1, 2]))
+        assert a == b
+        timed('XlsxLoad(lazy = True).get_personList', lambda: XlsxLoad(path, classname = '青书班', lazy = True).get_personList())
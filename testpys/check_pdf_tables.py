@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+在真实的报名pdf上核对PdfStream（PyMuPDF优先）与pdfplumber逐页提取的表格，以及报名表分类是否一致
+用法：python testpys/check_pdf_tables.py [目录或pdf文件 ...]，默认为报名文件输入目录
+"""
+import os
+import sys
+
+import pdfplumber
+
+from SSPY.fuzzy.search import searched_recursive as if_in
+from SSPY.globalconstants import GlobalConstants as gc
+from SSPY.helperfunction import clean_enter
+from SSPY.myff.document.pdf import PdfStream
+from SSPY.mypdf import PdfLoad
+from SSPY.parseperson import FORM_ANCHORS
+
+
+def collect(args: list[str]) -> list[str]:
+    paths = []
+    for a in args:
+        if os.path.isdir(a):
+            for root, _, files in os.walk(a):
+                paths.extend(os.path.join(root, f) for f in sorted(files) if f.lower().endswith('.pdf'))
+        elif a.lower().endswith('.pdf'):
+            paths.append(a)
+    return paths
+
+
+def classify(sheets) -> str:
+    """与signforqcSheet相同的pdf分类：先找班委报名表，再找学员报名表"""
+    for anchor, kind in (('应聘岗位', '班委'), ('所任职务', '学员')):
+        for sheet in sheets:
+            if if_in(anchor, sheet, target_as_sub = True, lib_as_sub = True): return kind
+    return '未知'
+
+
+def check(path: str) -> tuple[int, int, bool]:
+    """
+    Returns:
+        (页数, 表格不同的页数, 分类是否一致)
+    """
+    mine: list[list] = []
+    """PdfStream逐页的表格，由stop回调收集"""
+    stream = PdfStream(path, text = False, stop = lambda tables: mine.append(clean_enter(tables, '')) and False)
+    baseline = []
+    diff = 0
+    with pdfplumber.open(path) as pdf:
+        for number, page in enumerate(pdf.pages):
+            tables = clean_enter(page.extract_tables(), '')
+            baseline.extend(tables)
+            if tables != mine[number]:
+                diff += 1
+                print(f'  第{number + 1}页表格不同')
+    if len(stream.fallback_pages) > 0:
+        print(f'  使用pdfplumber的页面：{[n + 1 for n in stream.fallback_pages]}')
+    same = classify(baseline) == classify(PdfLoad(path, anchors = FORM_ANCHORS).sheets)
+    return len(mine), diff, same
+
+
+if __name__ == '__main__':
+    paths = collect(sys.argv[1:] or [gc.dir_INPUT_SIGNFORQC_])
+    total = diff_pages = diff_class = 0
+    for p in paths:
+        print(p)
+        n, d, same = check(p)
+        total += n
+        diff_pages += d
+        if not same:
+            diff_class += 1
+            print('  报名表分类不同')
+    print(f'{len(paths)}个文件，{total}页，表格不同{diff_pages}页，分类不同{diff_class}个文件')
@@ -191,7 +191,7 @@ class SSPYMainFrame(BaseFrame):
         postText(msg = '* 功能 2', color = 'green', ptime = False)
         postText(msg = '  ① 青字班的花名册请放置在与程序同源的文件夹 "input/all/" 中',
             color = 'green', ptime = False)
-        postText(msg = '  ② 请确保与程序同源的文件夹文件 "storage/storage.xlsx" 存在',
+        postText(msg = '  ② 请确保已运行过功能1（报名信息保存在 "storage/storage.db" 中，没有时读取 "storage/storage.xlsx"）',
             color = 'green', ptime = False)
         postText(msg = '  ③ 请确保签到照片的命名含有关键词且不多于一个',
             color = 'green', ptime = False)